@@ -1,10 +1,34 @@
 #!/usr/bin/env python3
 """Abstract base class for all site-specific scrapers."""
+import asyncio
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+import aiohttp
+
 from models.product import Product
 
 
+def _selector_groups(section: Optional[Dict[str, Any]]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Freeze a config 'selectors' section into a dict of selector tuples.
+
+    Args:
+        section: Mapping of field name to list of fallback selectors
+
+    Returns:
+        Dictionary mapping each field name to a tuple of selectors
+    """
+    return {
+        name: tuple(selectors)
+        for name, selectors in (section or {}).items()
+        if isinstance(selectors, list)
+    }
+
+
 class BaseScraper(ABC):
     """
     Abstract base class defining the interface for all site-specific scrapers.
@@ -15,11 +39,16 @@ class BaseScraper(ABC):
     Attributes:
         site_name: Name of the site (e.g., 'walmart', 'target')
         config: Site-specific configuration loaded from YAML
+        _cfg: Flattened view of the config fields used on hot paths
         browser_driver: Browser automation driver
         location_manager: Handles location/zipcode setting
         session_manager: Manages cookies and sessions
         rate_limiter: Controls request rate
         cache_manager: Caches responses
+
+    Subclasses making plain HTTP requests should use the shared, pooled
+    session from _get_http() rather than one-off aiohttp.request() calls,
+    so TCP/TLS connections are reused across requests.
     """
 
     def __init__(
@@ -42,14 +71,53 @@ class BaseScraper(ABC):
             rate_limiter: Rate limiter instance
             cache_manager: Cache manager instance
         """
-        self.site_name = config.get('site', {}).get('name', 'unknown')
+        site = config.get('site', {})
+        self.site_name = site.get('name', 'unknown')
         self.config = config
+
+        # Resolve nested config once so per-page code does attribute reads
+        # instead of walking dicts on every call
+        location = config.get('location', {})
+        search = config.get('search', {})
+        search_selectors = _selector_groups(search.get('selectors'))
+        self._cfg = SimpleNamespace(
+            site_name=self.site_name,
+            base_url=site.get('base_url'),
+            http_first=site.get('http_first', False),
+            location_selectors=_selector_groups(location.get('selectors')),
+            search_url_template=search.get('url_template'),
+            product_card_selectors=search_selectors.get('product_cards', ()),
+            product_link_selectors=search_selectors.get('product_link', ()),
+            product_selectors=_selector_groups(config.get('product', {}).get('selectors')),
+        )
+
         self.browser_driver = browser_driver
         self.location_manager = location_manager
         self.session_manager = session_manager
         self.rate_limiter = rate_limiter
         self.cache_manager = cache_manager
         self.current_zipcode: Optional[str] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    def _get_http(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        Must be called from within a running event loop.
+
+        Returns:
+            aiohttp ClientSession with a pooled keep-alive connector
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                )
+            )
+        return self._http
 
     @abstractmethod
     async def set_location(self, zipcode: str) -> bool:
@@ -96,12 +164,17 @@ class BaseScraper(ABC):
         raise NotImplementedError("Subclass must implement search_products()")
 
     @abstractmethod
-    async def get_product_details(self, product_url: str) -> Optional[Product]:
+    async def get_product_details(
+        self,
+        product_url: str,
+        scraped_at: Optional[datetime] = None
+    ) -> Optional[Product]:
         """
         Get full product details from a product page URL.
 
         Args:
             product_url: Full URL to product page
+            scraped_at: Timestamp to record on the product (default: now)
 
         Returns:
             Product object with all scraped details, or None if scraping failed
@@ -112,13 +185,19 @@ class BaseScraper(ABC):
         raise NotImplementedError("Subclass must implement get_product_details()")
 
     @abstractmethod
-    def parse_product(self, html: str, url: str) -> Optional[Product]:
+    def parse_product(
+        self,
+        html: Union[str, bytes],
+        url: str,
+        scraped_at: Optional[datetime] = None
+    ) -> Optional[Product]:
         """
         Parse product data from HTML content.
 
         Args:
-            html: HTML content of product page
+            html: HTML content of product page, as str or UTF-8 bytes
             url: URL of the product page
+            scraped_at: Timestamp to record on the product (default: now)
 
         Returns:
             Product object with parsed data, or None if parsing failed
@@ -128,6 +207,54 @@ class BaseScraper(ABC):
         """
         raise NotImplementedError("Subclass must implement parse_product()")
 
+    async def fetch_many(
+        self,
+        urls: List[str],
+        concurrency: int = 4
+    ) -> List[Optional[Product]]:
+        """
+        Get product details for many URLs concurrently.
+
+        At most `concurrency` get_product_details() calls run at once; the
+        rate limiter still spaces out the requests themselves. A failure
+        for one URL doesn't cancel the others. All products of the batch
+        share one scraped_at timestamp, taken when the batch starts.
+
+        Args:
+            urls: Product page URLs
+            concurrency: Maximum number of in-flight fetches (default: 4)
+
+        Returns:
+            List of products in the same order as urls (None where a fetch failed)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        scraped_at = datetime.now()
+
+        async def _bounded(url: str) -> Optional[Product]:
+            async with semaphore:
+                try:
+                    return await self.get_product_details(url, scraped_at)
+                except Exception:
+                    return None
+
+        if sys.version_info >= (3, 12):
+            # Start tasks eagerly: fetches that finish without suspending
+            # (e.g. cache hits) never go through the event loop scheduler
+            loop = asyncio.get_running_loop()
+            tasks = [
+                asyncio.Task(_bounded(url), loop=loop, eager_start=True)
+                for url in urls
+            ]
+            return list(await asyncio.gather(*tasks))
+
+        if hasattr(asyncio, 'TaskGroup'):
+            # Python 3.11
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_bounded(url)) for url in urls]
+            return [task.result() for task in tasks]
+
+        return await asyncio.gather(*(_bounded(url) for url in urls))
+
     async def validate_location(self, expected_zipcode: str) -> bool:
         """
         Validate that the location was set correctly.
@@ -163,10 +290,14 @@ class BaseScraper(ABC):
 
     async def cleanup(self):
         """
-        Cleanup resources (close browser, save sessions, etc.).
+        Cleanup resources (close browser, HTTP session, save sessions, etc.).
 
         Can be overridden by subclasses for custom cleanup logic.
         """
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
         if self.browser_driver:
             await self.browser_driver.close()
 
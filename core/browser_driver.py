@@ -1,11 +1,43 @@
 #!/usr/bin/env python3
 """Browser automation driver with Playwright stealth mode."""
 import asyncio
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 from playwright_stealth import stealth_async
 
 
+class PageLease:
+    """
+    Async context manager that borrows a page from a BrowserDriver's pool.
+
+    Usage:
+        async with driver.lease_page() as page:
+            await page.goto(url)
+    """
+
+    def __init__(self, driver: 'BrowserDriver'):
+        """
+        Initialize page lease.
+
+        Args:
+            driver: Browser driver owning the page pool
+        """
+        self.driver = driver
+        self.page: Optional[Page] = None
+
+    async def __aenter__(self) -> Page:
+        """Acquire a page from the pool."""
+        self.page = await self.driver.acquire_page()
+        return self.page
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Return the page to the pool."""
+        if self.page:
+            await self.driver.release_page(self.page)
+            self.page = None
+
+
 class BrowserDriver:
     """
     Abstraction over Playwright browser automation.
@@ -15,14 +47,34 @@ class BrowserDriver:
     - Cookie management
     - User agent control
     - Configurable headless/headful mode
+    - One browser process shared by many short-lived contexts
+    - Pool of warm pages reused across requests
     """
 
+    # Chromium launch flags; swap this tuple to rotate the launch fingerprint
+    _LAUNCH_ARGS: Tuple[str, ...] = (
+        '--disable-blink-features=AutomationControlled',
+        '--disable-dev-shm-usage',
+        '--no-sandbox',
+        '--disable-web-security',
+        '--disable-features=IsolateOrigins,site-per-process',
+        '--ignore-certificate-errors',
+    )
+
+    # Context options shared by every context (viewport/user agent added per driver)
+    _DEFAULT_CTX_OPTS: Dict[str, Any] = {
+        'locale': 'en-US',
+        'timezone_id': 'America/New_York',
+    }
+
     def __init__(
         self,
         headless: bool = True,
         user_agent: Optional[str] = None,
         viewport: Optional[Dict[str, int]] = None,
         browser_type: str = 'firefox',  # Changed default to firefox
+        max_contexts: int = 4,
+        max_pages: int = 4,
     ):
         """
         Initialize browser driver.
@@ -32,11 +84,22 @@ class BrowserDriver:
             user_agent: Custom user agent string (default: None = use default)
             viewport: Custom viewport size dict with 'width' and 'height' (default: 1920x1080)
             browser_type: Browser to use ('chromium', 'firefox', 'webkit') (default: 'firefox')
+            max_contexts: Maximum concurrent contexts vended by open_context() (default: 4)
+            max_pages: Maximum pages kept in the page pool (default: 4)
         """
         self.headless = headless
         self.user_agent = user_agent
         self.viewport = viewport or {'width': 1920, 'height': 1080}
         self.browser_type = browser_type
+        self.max_contexts = max_contexts
+        self._context_slots = asyncio.Semaphore(max_contexts)
+        self._launch_lock = asyncio.Lock()
+
+        # Pool of idle pages in the default context. None entries are
+        # wake-ups for waiters after a broken page was discarded.
+        self.max_pages = max_pages
+        self._page_pool: asyncio.Queue = asyncio.Queue()
+        self._pool_size = 0  # Pages created for the pool (idle + leased)
 
         # Playwright instances
         self.playwright = None
@@ -48,74 +111,207 @@ class BrowserDriver:
         """
         Start browser instance.
 
-        Initializes Playwright, launches browser with stealth settings,
-        and creates a new page.
-        """
-        # Start Playwright
-        self.playwright = await async_playwright().start()
-
-        # Select browser engine
-        if self.browser_type == 'firefox':
-            # Firefox: Better DNS resolution, more stable
-            self.browser = await self.playwright.firefox.launch(
-                headless=self.headless,
-            )
-        elif self.browser_type == 'webkit':
-            # WebKit (Safari engine)
-            self.browser = await self.playwright.webkit.launch(
-                headless=self.headless,
-            )
-        else:
-            # Chromium: More features but DNS issues on some systems
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                    '--ignore-certificate-errors',
-                ],
-                chromium_sandbox=False,
-            )
+        Launches the browser (if not already running) and creates the
+        default context and page used by get(), click(), fill(), etc.
+        """
+        await self.start_browser()
+        self.context = await self.new_context()
+        self.page = await self.new_page(self.context)
+
+    async def start_browser(self) -> None:
+        """
+        Start Playwright and launch the browser process.
+
+        Launching is the expensive step (1-3 s), so it happens once per
+        driver; calling this again while the browser is running is a no-op.
+        """
+        async with self._launch_lock:
+            if self.browser:
+                return
+
+            # Start Playwright
+            self.playwright = await async_playwright().start()
+
+            # Select browser engine
+            if self.browser_type == 'firefox':
+                # Firefox: Better DNS resolution, more stable
+                self.browser = await self.playwright.firefox.launch(
+                    headless=self.headless,
+                )
+            elif self.browser_type == 'webkit':
+                # WebKit (Safari engine)
+                self.browser = await self.playwright.webkit.launch(
+                    headless=self.headless,
+                )
+            else:
+                # Chromium: More features but DNS issues on some systems
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=list(self._LAUNCH_ARGS),
+                    chromium_sandbox=False,
+                )
+
+    async def new_context(self, **overrides: Any) -> BrowserContext:
+        """
+        Create a new browser context on the running browser.
+
+        Args:
+            **overrides: Context options overriding the driver defaults
+
+        Returns:
+            New BrowserContext (caller is responsible for closing it)
+
+        Raises:
+            RuntimeError: If browser is not started
+        """
+        if not self.browser:
+            raise RuntimeError("Browser not started. Call start_browser() first.")
 
         # Create context with custom settings
-        context_options = {
-            'viewport': self.viewport,
-            'locale': 'en-US',
-            'timezone_id': 'America/New_York',
-        }
+        context_options = {**self._DEFAULT_CTX_OPTS, 'viewport': self.viewport}
 
         if self.user_agent:
             context_options['user_agent'] = self.user_agent
 
-        self.context = await self.browser.new_context(**context_options)
+        context_options.update(overrides)
+        return await self.browser.new_context(**context_options)
 
-        # Create page
-        self.page = await self.context.new_page()
+    async def new_page(self, context: Optional[BrowserContext] = None) -> Page:
+        """
+        Create a new page with stealth applied.
+
+        Args:
+            context: Context to open the page in (default: the driver's context)
+
+        Returns:
+            New Page
+
+        Raises:
+            RuntimeError: If no context is available
+        """
+        context = context or self.context
+        if not context:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        page = await context.new_page()
 
         # Apply stealth mode to hide automation (works best with Chromium)
         if self.browser_type == 'chromium':
             try:
-                await stealth_async(self.page)
+                await stealth_async(page)
             except Exception:
                 pass  # Stealth mode optional, continue anyway
 
+        return page
+
+    @asynccontextmanager
+    async def open_context(self, **overrides: Any) -> AsyncIterator[BrowserContext]:
+        """
+        Open a short-lived context on the shared browser.
+
+        At most max_contexts are open at once; further callers wait for a
+        free slot. The context is closed on exit.
+
+        Args:
+            **overrides: Context options overriding the driver defaults
+
+        Yields:
+            BrowserContext
+        """
+        async with self._context_slots:
+            await self.start_browser()
+            context = await self.new_context(**overrides)
+            try:
+                yield context
+            finally:
+                await context.close()
+
+    async def acquire_page(self) -> Page:
+        """
+        Borrow a page from the pool, creating one if the pool isn't full.
+
+        Pages are created in the default context (so they share its cookies)
+        and have stealth applied once, at creation. Waits for a page to be
+        released if max_pages are already leased.
+
+        Returns:
+            Page for exclusive use until release_page() is called
+
+        Raises:
+            RuntimeError: If browser is not started
+        """
+        if not self.context:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        while True:
+            try:
+                page = self._page_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                if self._pool_size < self.max_pages:
+                    self._pool_size += 1
+                    try:
+                        return await self.new_page(self.context)
+                    except Exception:
+                        self._pool_size -= 1
+                        raise
+                page = await self._page_pool.get()
+
+            if page is not None:
+                return page
+
+    async def release_page(self, page: Page) -> None:
+        """
+        Reset a borrowed page and return it to the pool.
+
+        Pages that fail to reset are closed and dropped from the pool.
+
+        Args:
+            page: Page previously returned by acquire_page()
+        """
+        try:
+            await page.goto('about:blank')
+        except Exception:
+            self._pool_size -= 1
+            try:
+                await page.close()
+            except Exception:
+                pass
+            self._page_pool.put_nowait(None)
+            return
+
+        self._page_pool.put_nowait(page)
+
+    def lease_page(self) -> PageLease:
+        """
+        Borrow a pooled page for the duration of an async with block.
+
+        Returns:
+            PageLease context manager yielding a Page
+        """
+        return PageLease(self)
+
     async def get(
         self,
         url: str,
-        wait_until: str = 'networkidle',
-        timeout: int = 30000
+        wait_until: str = 'domcontentloaded',
+        timeout: int = 30000,
+        wait_for: Optional[str] = None,
+        page: Optional[Page] = None,
     ) -> str:
         """
         Navigate to URL and return page HTML.
 
+        Retail pages rarely reach 'networkidle' because of trackers, so the
+        default only waits for the DOM; pass wait_for to additionally wait
+        for the element the caller actually needs.
+
         Args:
             url: URL to navigate to
             wait_until: When to consider navigation complete
                        ('load', 'domcontentloaded', 'networkidle')
             timeout: Navigation timeout in milliseconds
+            wait_for: Optional CSS selector to wait for after navigation
+            page: Page to navigate, e.g. a pooled page (default: the driver's page)
 
         Returns:
             Page HTML content
@@ -123,11 +319,14 @@ class BrowserDriver:
         Raises:
             RuntimeError: If browser is not started
         """
-        if not self.page:
+        page = page or self.page
+        if not page:
             raise RuntimeError("Browser not started. Call start() first.")
 
-        await self.page.goto(url, wait_until=wait_until, timeout=timeout)
-        return await self.page.content()
+        await page.goto(url, wait_until=wait_until, timeout=timeout)
+        if wait_for:
+            await page.wait_for_selector(wait_for, timeout=timeout)
+        return await page.content()
 
     async def click(
         self,
@@ -167,7 +366,8 @@ class BrowserDriver:
             selector: CSS selector for input element
             value: Value to fill
             timeout: Wait timeout in milliseconds
-            clear_first: Clear field before filling (default: True)
+            clear_first: Kept for backward compatibility; page.fill() always
+                         replaces the existing value
 
         Raises:
             RuntimeError: If browser is not started
@@ -175,9 +375,6 @@ class BrowserDriver:
         if not self.page:
             raise RuntimeError("Browser not started. Call start() first.")
 
-        if clear_first:
-            await self.page.fill(selector, '', timeout=timeout)
-
         await self.page.fill(selector, value, timeout=timeout)
 
     async def wait_for_selector(
@@ -202,6 +399,22 @@ class BrowserDriver:
 
         await self.page.wait_for_selector(selector, timeout=timeout, state=state)
 
+    # Scrolls until document height stops growing; resolves with final height
+    _SCROLL_TO_BOTTOM_JS = """
+        async (delay) => {
+            let previous = 0;
+            while (true) {
+                const height = document.body.scrollHeight;
+                if (height === previous) {
+                    return height;
+                }
+                window.scrollTo(0, height);
+                previous = height;
+                await new Promise(resolve => setTimeout(resolve, delay * 1000));
+            }
+        }
+    """
+
     async def scroll_to_bottom(self, delay: float = 0.5) -> None:
         """
         Scroll to bottom of page (useful for infinite scroll).
@@ -215,18 +428,8 @@ class BrowserDriver:
         if not self.page:
             raise RuntimeError("Browser not started. Call start() first.")
 
-        previous_height = 0
-        while True:
-            # Scroll to bottom
-            current_height = await self.page.evaluate('document.body.scrollHeight')
-
-            if current_height == previous_height:
-                # No more content to load
-                break
-
-            await self.page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(delay)
-            previous_height = current_height
+        # Run the whole loop in the page: one round-trip instead of two per step
+        await self.page.evaluate(self._SCROLL_TO_BOTTOM_JS, delay)
 
     async def get_cookies(self) -> List[Dict[str, Any]]:
         """
@@ -301,8 +504,11 @@ class BrowserDriver:
             self.page = None
 
         if self.context:
+            # Closing the context also closes any pooled pages
             await self.context.close()
             self.context = None
+            self._page_pool = asyncio.Queue()
+            self._pool_size = 0
 
         if self.browser:
             await self.browser.close()
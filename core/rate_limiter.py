@@ -3,8 +3,12 @@
 import asyncio
 import random
 import time
+from collections import deque
 from typing import Dict, Optional
-from datetime import datetime, timedelta
+
+
+# Number of jitter delays generated per refill of the jitter buffer
+JITTER_BATCH_SIZE = 1024
 
 
 class RateLimiter:
@@ -36,14 +40,41 @@ class RateLimiter:
         self.min_delay = min_delay
         self.max_delay = max_delay
 
+        # Refill rate is constant, so precompute both directions once
+        self._tokens_per_sec = requests_per_minute / 60.0
+        self._sec_per_token = 60.0 / requests_per_minute
+
         # Token bucket state per site
         self.tokens: Dict[str, float] = {}
-        self.last_refill: Dict[str, datetime] = {}
+        self.last_refill: Dict[str, float] = {}
 
         # Backoff state per site
         self.backoff_multiplier: Dict[str, float] = {}
+        self.backoff_until: Dict[str, float] = {}  # monotonic deadline from Retry-After
         self.last_request_time: Dict[str, float] = {}
 
+        # Serializes acquire() per site so concurrent callers queue up
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        # Pre-generated random delays, refilled in batches from a private RNG
+        self._rng = random.Random()
+        self._jitter: deque = deque()
+
+    def _next_jitter(self) -> float:
+        """
+        Get the next random base delay, refilling the buffer when empty.
+
+        Returns:
+            Delay in seconds between min_delay and max_delay
+        """
+        if not self._jitter:
+            uniform = self._rng.uniform
+            self._jitter.extend(
+                uniform(self.min_delay, self.max_delay)
+                for _ in range(JITTER_BATCH_SIZE)
+            )
+        return self._jitter.popleft()
+
     def _refill_tokens(self, site: str) -> None:
         """
         Refill tokens based on time elapsed since last refill.
@@ -51,7 +82,7 @@ class RateLimiter:
         Args:
             site: Site name to refill tokens for
         """
-        now = datetime.now()
+        now = time.monotonic()
 
         # Initialize if first request
         if site not in self.last_refill:
@@ -60,8 +91,8 @@ class RateLimiter:
             return
 
         # Calculate tokens to add based on time elapsed
-        elapsed = (now - self.last_refill[site]).total_seconds()
-        tokens_to_add = (elapsed / 60.0) * self.requests_per_minute
+        elapsed = now - self.last_refill[site]
+        tokens_to_add = elapsed * self._tokens_per_sec
 
         # Add tokens (capped at max)
         self.tokens[site] = min(
@@ -75,34 +106,81 @@ class RateLimiter:
         Wait until a request is allowed for the given site.
 
         This method will:
+        0. Wait out any server-advertised Retry-After cool-down
         1. Refill tokens if enough time has passed
-        2. Wait if no tokens are available
+        2. Sleep exactly until the next token is available if none are left
         3. Add a random delay to mimic human behavior
         4. Apply backoff multiplier if needed
 
+        Concurrent callers for the same site are served one at a time, so
+        the delays space requests out instead of all expiring together.
+
         Args:
             site: Site name to acquire rate limit token for
         """
-        # Refill tokens
-        self._refill_tokens(site)
+        lock = self._locks.get(site)
+        if lock is None:
+            lock = self._locks[site] = asyncio.Lock()
+
+        async with lock:
+            await self._acquire(site)
+
+    async def _acquire(self, site: str) -> None:
+        """
+        Wait for and consume one token for a site (caller holds the site lock).
+
+        Args:
+            site: Site name to acquire rate limit token for
+        """
+        await self._wait_retry_after(site)
+        await self._wait_for_token(site)
+        await self._wait_delay(site, self.backoff_multiplier.get(site, 1.0))
 
-        # Wait if no tokens available
-        while self.tokens.get(site, 0) < 1.0:
-            wait_time = 1.0  # Wait 1 second and check again
+    async def _wait_retry_after(self, site: str) -> None:
+        """
+        Sleep until a Retry-After cool-down set by trigger_backoff() ends.
+
+        Args:
+            site: Site name
+        """
+        until = self.backoff_until.pop(site, None)
+        if until is not None:
+            remaining = until - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+    async def _wait_for_token(self, site: str) -> None:
+        """
+        Wait until a token is available for a site and consume it.
+
+        Args:
+            site: Site name to consume a token for
+        """
+        # Refill tokens. Refill is linear in elapsed time, so the wait for
+        # the next token is known up front - sleep once instead of polling
+        wait_time = self.get_wait_time(site)
+        if wait_time > 0:
             await asyncio.sleep(wait_time)
             self._refill_tokens(site)
 
         # Consume one token
         self.tokens[site] -= 1.0
 
+    async def _wait_delay(self, site: str, backoff: float) -> None:
+        """
+        Sleep a randomized, backoff-scaled delay since the last request.
+
+        Args:
+            site: Site name
+            backoff: Backoff multiplier to apply to the random delay
+        """
         # Calculate delay with backoff
-        base_delay = random.uniform(self.min_delay, self.max_delay)
-        backoff = self.backoff_multiplier.get(site, 1.0)
+        base_delay = self._next_jitter()
         total_delay = base_delay * backoff
 
         # Ensure minimum time since last request
         if site in self.last_request_time:
-            time_since_last = time.time() - self.last_request_time[site]
+            time_since_last = time.monotonic() - self.last_request_time[site]
             if time_since_last < total_delay:
                 additional_wait = total_delay - time_since_last
                 await asyncio.sleep(additional_wait)
@@ -110,19 +188,32 @@ class RateLimiter:
             await asyncio.sleep(total_delay)
 
         # Record request time
-        self.last_request_time[site] = time.time()
+        self.last_request_time[site] = time.monotonic()
 
-    def trigger_backoff(self, site: str, multiplier: float = 2.0) -> None:
+    def trigger_backoff(
+        self,
+        site: str,
+        multiplier: float = 2.0,
+        *,
+        retry_after: Optional[float] = None
+    ) -> None:
         """
         Increase delays temporarily after hitting rate limits.
 
         This is typically called when receiving 429 (Too Many Requests)
-        or 503 (Service Unavailable) responses.
+        or 503 (Service Unavailable) responses. If the response carried a
+        Retry-After header, pass it: the next acquire() waits exactly that
+        long instead of scaling delays by a guessed multiplier.
 
         Args:
             site: Site name to apply backoff to
             multiplier: Factor to multiply delays by (default: 2.0)
+            retry_after: Seconds the server asked us to wait (Retry-After)
         """
+        if retry_after is not None:
+            self.backoff_until[site] = time.monotonic() + max(retry_after, 0.0)
+            return
+
         current_backoff = self.backoff_multiplier.get(site, 1.0)
         self.backoff_multiplier[site] = min(current_backoff * multiplier, 10.0)
 
@@ -134,6 +225,7 @@ class RateLimiter:
             site: Site name to reset backoff for
         """
         self.backoff_multiplier[site] = 1.0
+        self.backoff_until.pop(site, None)
 
     def get_current_rate(self, site: str) -> float:
         """
@@ -191,8 +283,7 @@ class RateLimiter:
 
         # Calculate time needed to refill one token
         tokens_needed = 1.0 - tokens
-        seconds_per_token = 60.0 / self.requests_per_minute
-        return tokens_needed * seconds_per_token
+        return tokens_needed * self._sec_per_token
 
     def __str__(self) -> str:
         """String representation."""
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Redis-backed rate limiter shared across scraper worker processes."""
+import asyncio
+from typing import Optional, Set
+
+import redis.asyncio as aioredis
+
+from core.rate_limiter import RateLimiter
+
+
+# Atomically refill the bucket, then either take a token (returns 0) or
+# return the milliseconds until one is available. Uses the Redis server
+# clock so all workers agree on elapsed time.
+#   KEYS[1] = bucket key, ARGV[1] = capacity, ARGV[2] = tokens per second
+_ACQUIRE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+
+local wait_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait_ms = math.ceil((1 - tokens) / rate * 1000)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) * 2)
+return wait_ms
+"""
+
+# Multiply the shared backoff (capped at 10x) and return the new value.
+#   KEYS[1] = backoff key, ARGV[1] = multiplier
+_BACKOFF_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1])) or 1.0
+local backoff = math.min(current * tonumber(ARGV[1]), 10.0)
+redis.call('SET', KEYS[1], backoff)
+return tostring(backoff)
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    Token bucket rate limiter whose state lives in Redis.
+
+    The per-process RateLimiter lets N workers each send the configured
+    rate, so the site sees N times the traffic. This variant keeps one
+    bucket per site in Redis (key '{prefix}:{site}'), so all workers share
+    the quota. Backoff multipliers are shared the same way
+    ('{prefix}:{site}:backoff'), as are Retry-After cool-downs
+    ('{prefix}:{site}:until', expiring when the cool-down ends).
+
+    Randomized delays are still applied locally by each worker.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = 'redis://localhost:6379/0',
+        requests_per_minute: int = 10,
+        min_delay: float = 2.0,
+        max_delay: float = 5.0,
+        key_prefix: str = 'rl',
+        client: Optional[aioredis.Redis] = None,
+    ):
+        """
+        Initialize Redis rate limiter.
+
+        Args:
+            redis_url: Redis connection URL (ignored if client is given)
+            requests_per_minute: Maximum requests per minute across all workers
+            min_delay: Minimum delay between requests in seconds
+            max_delay: Maximum delay between requests in seconds
+            key_prefix: Prefix for Redis keys (default: 'rl')
+            client: Existing redis.asyncio client to use
+        """
+        super().__init__(
+            requests_per_minute=requests_per_minute,
+            min_delay=min_delay,
+            max_delay=max_delay,
+        )
+        self.redis = client or aioredis.from_url(redis_url)
+        self.key_prefix = key_prefix
+        self._acquire_script = self.redis.register_script(_ACQUIRE_SCRIPT)
+        self._backoff_script = self.redis.register_script(_BACKOFF_SCRIPT)
+
+        # Fire-and-forget backoff writes issued from the sync backoff API
+        self._pending: Set[asyncio.Task] = set()
+
+    def _bucket_key(self, site: str) -> str:
+        """Get the Redis key holding a site's token bucket."""
+        return f"{self.key_prefix}:{site}"
+
+    def _backoff_key(self, site: str) -> str:
+        """Get the Redis key holding a site's backoff multiplier."""
+        return f"{self.key_prefix}:{site}:backoff"
+
+    def _until_key(self, site: str) -> str:
+        """Get the Redis key whose TTL is a site's Retry-After cool-down."""
+        return f"{self.key_prefix}:{site}:until"
+
+    async def _wait_retry_after(self, site: str) -> None:
+        """
+        Sleep until the shared Retry-After cool-down for a site ends.
+
+        Args:
+            site: Site name
+        """
+        remaining_ms = await self.redis.pttl(self._until_key(site))
+        if remaining_ms > 0:
+            await asyncio.sleep(remaining_ms / 1000.0)
+
+    async def _wait_for_token(self, site: str) -> None:
+        """
+        Wait until the shared bucket grants a token for a site.
+
+        Args:
+            site: Site name to consume a token for
+        """
+        while True:
+            wait_ms = await self._acquire_script(
+                keys=[self._bucket_key(site)],
+                args=[self.requests_per_minute, self._tokens_per_sec],
+            )
+            if not wait_ms:
+                return
+            await asyncio.sleep(int(wait_ms) / 1000.0)
+
+    async def _acquire(self, site: str) -> None:
+        """
+        Take a token from the shared bucket, then apply the shared backoff.
+
+        Args:
+            site: Site name to acquire rate limit token for
+        """
+        await self._wait_retry_after(site)
+        await self._wait_for_token(site)
+
+        shared = await self.redis.get(self._backoff_key(site))
+        backoff = float(shared) if shared is not None else 1.0
+        self.backoff_multiplier[site] = backoff
+
+        await self._wait_delay(site, backoff)
+
+    def _spawn(self, coro) -> None:
+        """
+        Run a Redis write in the background from a synchronous method.
+
+        Args:
+            coro: Coroutine to schedule on the running event loop
+        """
+        task = asyncio.get_running_loop().create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _store_backoff(self, site: str, multiplier: float) -> None:
+        """Multiply the shared backoff for a site."""
+        backoff = await self._backoff_script(
+            keys=[self._backoff_key(site)], args=[multiplier]
+        )
+        self.backoff_multiplier[site] = float(backoff)
+
+    def trigger_backoff(
+        self,
+        site: str,
+        multiplier: float = 2.0,
+        *,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Increase delays for all workers after hitting rate limits.
+
+        Must be called from within a running event loop.
+
+        Args:
+            site: Site name to apply backoff to
+            multiplier: Factor to multiply delays by (default: 2.0)
+            retry_after: Seconds the server asked us to wait (Retry-After)
+        """
+        super().trigger_backoff(site, multiplier, retry_after=retry_after)
+
+        if retry_after is not None:
+            if retry_after > 0:
+                self._spawn(self.redis.set(
+                    self._until_key(site), 1, px=max(int(retry_after * 1000), 1)
+                ))
+            return
+
+        self._spawn(self._store_backoff(site, multiplier))
+
+    def reset_backoff(self, site: str) -> None:
+        """
+        Reset the shared backoff multiplier to normal.
+
+        Must be called from within a running event loop.
+
+        Args:
+            site: Site name to reset backoff for
+        """
+        super().reset_backoff(site)
+        self._spawn(self.redis.delete(self._backoff_key(site), self._until_key(site)))
+
+    async def close(self) -> None:
+        """Wait for pending backoff writes and close the Redis connection."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self.redis.aclose()
+
+    def __str__(self) -> str:
+        """String representation."""
+        return (
+            f"RedisRateLimiter(rpm={self.requests_per_minute}, "
+            f"delay={self.min_delay}-{self.max_delay}s, prefix='{self.key_prefix}')"
+        )
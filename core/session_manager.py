@@ -1,10 +1,24 @@
 #!/usr/bin/env python3
 """Session management for persisting cookies and browser state."""
-import json
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
+from utils import json_utils
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 
 class SessionManager:
     """
@@ -16,15 +30,34 @@ class SessionManager:
     - Timestamp
     - Zipcode information
     - Expiration time
+
+    A manifest (.cache/sessions/_index.json) mirrors each session's site,
+    zipcode and creation time so listing and cleanup don't have to open
+    every session file. Every manifest update re-reads it from disk under
+    an exclusive lock (.cache/sessions/_index.lock, POSIX only), so
+    sessions saved by other instances or processes aren't lost.
+
+    When msgpack is installed, cookies are stored in a binary sibling file
+    ({site}_{zipcode}.msgpack) referenced by the session's 'cookies_blob'
+    key; sessions with inline JSON cookies are still read as before.
     """
 
-    def __init__(self, cache_dir: Path = None, max_age_hours: int = 24):
+    INDEX_FILENAME = '_index.json'
+    INDEX_LOCK_FILENAME = '_index.lock'
+
+    def __init__(
+        self,
+        cache_dir: Path = None,
+        max_age_hours: int = 24,
+        memory_cache_size: int = 128,
+    ):
         """
         Initialize session manager.
 
         Args:
             cache_dir: Directory to store session files (default: .cache/sessions)
             max_age_hours: Maximum age of sessions before they expire (default: 24)
+            memory_cache_size: Number of parsed sessions kept in memory (default: 128)
         """
         if cache_dir is None:
             cache_dir = Path(__file__).parent.parent / '.cache' / 'sessions'
@@ -33,6 +66,21 @@ class SessionManager:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_age = timedelta(hours=max_age_hours)
 
+        # (site, zipcode) -> session file path, built once per pair
+        self._path_cache: Dict[Tuple[str, str], Path] = {}
+
+        # LRU of parsed sessions: (site, zipcode) -> (file mtime_ns, session)
+        self.memory_cache_size = memory_cache_size
+        self._mem_cache: 'OrderedDict[Tuple[str, str], Tuple[int, Dict[str, Any]]]' = OrderedDict()
+
+        # Session metadata manifest: filename -> {site, zipcode, created_at}
+        self.index_path = self.cache_dir / self.INDEX_FILENAME
+        self.index_lock_path = self.cache_dir / self.INDEX_LOCK_FILENAME
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        # (inode, mtime_ns) of the manifest file self._index was read from;
+        # every atomic write replaces the inode
+        self._index_stamp: Optional[Tuple[int, int]] = None
+
     def _get_session_path(self, site: str, zipcode: str) -> Path:
         """
         Get file path for session storage.
@@ -44,8 +92,199 @@ class SessionManager:
         Returns:
             Path to session file
         """
-        filename = f"{site}_{zipcode}.json"
-        return self.cache_dir / filename
+        key = (site, zipcode)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._path_cache[key] = self.cache_dir / f"{site}_{zipcode}.json"
+        return path
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """
+        Write a file in one write() call and atomically move it into place.
+
+        Readers (including other scraper processes) see either the old or
+        the new file, never a partially written one.
+
+        Args:
+            path: Destination file path
+            data: Complete file contents
+        """
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _unlink_session(self, session_path: Path) -> None:
+        """
+        Delete a session file and its cookie blob, if any.
+
+        Args:
+            session_path: Path to the session JSON file
+        """
+        session_path.unlink(missing_ok=True)
+        session_path.with_suffix('.msgpack').unlink(missing_ok=True)
+
+    def _session_files(self, pattern: str = '*.json') -> List[Path]:
+        """
+        List session files in the cache directory, excluding the manifest.
+
+        Args:
+            pattern: Glob pattern to match (default: all sessions)
+
+        Returns:
+            List of session file paths
+        """
+        return [
+            p for p in self.cache_dir.glob(pattern)
+            if p.name != self.INDEX_FILENAME
+        ]
+
+    @contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the session manifest.
+
+        The lock is shared with other processes through flock() on a lock
+        file; where fcntl is unavailable this is a no-op.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.index_lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Read the session manifest from disk into self._index.
+
+        Returns:
+            The manifest, or None if it is missing or unreadable
+        """
+        try:
+            with open(self.index_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                index = json_utils.loads(f.read())
+        except Exception:
+            return None
+
+        self._index = index
+        self._index_stamp = (st.st_ino, st.st_mtime_ns)
+        return index
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the session manifest, reloading it if it changed on disk.
+
+        The manifest is rebuilt from the session files if it is missing or
+        unreadable.
+
+        Returns:
+            Dictionary mapping session filename to its metadata
+        """
+        try:
+            st = self.index_path.stat()
+        except OSError:
+            st = None
+
+        if st is not None:
+            if self._index is not None and self._index_stamp == (st.st_ino, st.st_mtime_ns):
+                return self._index
+            index = self._read_index()
+            if index is not None:
+                return index
+
+        with self._index_lock():
+            index = self._read_index()
+            if index is None:
+                self._index = self._rebuild_index()
+                self._write_index()
+
+        return self._index
+
+    def _rebuild_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Rebuild the session manifest by scanning the cache directory.
+
+        Site and zipcode come from the {site}_{zipcode}.json filename and
+        the creation time from the file's mtime (written by save_session),
+        so no session file has to be opened or parsed.
+
+        Returns:
+            Dictionary mapping session filename to its metadata
+        """
+        index = {}
+
+        for session_file in self._session_files():
+            site, sep, zipcode = session_file.stem.rpartition('_')
+            if not sep:
+                continue
+
+            try:
+                mtime = session_file.stat().st_mtime
+            except OSError:
+                continue
+
+            index[session_file.name] = {
+                'site': site,
+                'zipcode': zipcode,
+                'created_at': datetime.fromtimestamp(mtime).isoformat(),
+            }
+
+        return index
+
+    def _write_index(self) -> None:
+        """Persist the session manifest to disk (caller holds the index lock)."""
+        try:
+            self._atomic_write(self.index_path, json_utils.dumps(self._index or {}, indent=True))
+            st = self.index_path.stat()
+            self._index_stamp = (st.st_ino, st.st_mtime_ns)
+        except Exception as e:
+            print(f"Warning: Failed to write session index: {e}")
+
+    def _update_index(self, changes: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """
+        Apply changes to the on-disk session manifest and persist it.
+
+        The manifest is re-read under the index lock first, so entries
+        written by other instances since it was last loaded are kept.
+
+        Args:
+            changes: Session filename -> new metadata, or None to remove it
+        """
+        with self._index_lock():
+            index = self._read_index()
+            changed = index is None
+            if index is None:
+                index = self._index = self._rebuild_index()
+
+            for name, entry in changes.items():
+                if entry is not None:
+                    index[name] = entry
+                    changed = True
+                elif index.pop(name, None) is not None:
+                    changed = True
+
+            if changed:
+                self._write_index()
+
+    def _remove_from_index(self, filenames: List[str]) -> None:
+        """
+        Drop entries from the session manifest and persist it.
+
+        Args:
+            filenames: Session filenames to remove
+        """
+        if filenames:
+            self._update_index(dict.fromkeys(filenames))
 
     def save_session(
         self,
@@ -66,19 +305,35 @@ class SessionManager:
         session_data = {
             'site': site,
             'zipcode': zipcode,
-            'cookies': cookies,
             'metadata': metadata or {},
             'created_at': datetime.now().isoformat(),
             'version': '1.0',
         }
 
         session_path = self._get_session_path(site, zipcode)
+        self._mem_cache.pop((site, zipcode), None)
 
         try:
-            with open(session_path, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            if msgpack is not None:
+                # Cookie jars can be large; msgpack is faster and smaller than JSON
+                blob_path = session_path.with_suffix('.msgpack')
+                self._atomic_write(blob_path, msgpack.packb(cookies))
+                session_data['cookies_blob'] = blob_path.name
+            else:
+                session_data['cookies'] = cookies
+
+            self._atomic_write(session_path, json_utils.dumps(session_data, indent=True))
         except Exception as e:
             print(f"Warning: Failed to save session for {site}/{zipcode}: {e}")
+            return
+
+        self._update_index({
+            session_path.name: {
+                'site': site,
+                'zipcode': zipcode,
+                'created_at': session_data['created_at'],
+            },
+        })
 
     def load_session(self, site: str, zipcode: str) -> Optional[Dict[str, Any]]:
         """
@@ -92,18 +347,40 @@ class SessionManager:
             Session data dictionary if valid session exists, None otherwise
         """
         session_path = self._get_session_path(site, zipcode)
+        key = (site, zipcode)
 
-        if not session_path.exists():
+        try:
+            mtime_ns = session_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._mem_cache.pop(key, None)
             return None
 
         try:
-            with open(session_path, 'r') as f:
-                session_data = json.load(f)
+            # Serve from memory if the file hasn't changed since it was parsed
+            cached = self._mem_cache.get(key)
+            if cached and cached[0] == mtime_ns:
+                self._mem_cache.move_to_end(key)
+                session_data = cached[1]
+            else:
+                with open(session_path, 'rb') as f:
+                    session_data = json_utils.loads(f.read())
+
+                if 'cookies_blob' in session_data:
+                    if msgpack is None:
+                        raise RuntimeError("session cookies require msgpack")
+                    blob = (self.cache_dir / session_data['cookies_blob']).read_bytes()
+                    session_data['cookies'] = msgpack.unpackb(blob, raw=False)
+
+                self._mem_cache[key] = (mtime_ns, session_data)
+                if len(self._mem_cache) > self.memory_cache_size:
+                    self._mem_cache.popitem(last=False)
 
             # Validate session
             if not self.is_session_valid(session_data):
                 # Delete expired session
-                session_path.unlink()
+                self._mem_cache.pop(key, None)
+                self._unlink_session(session_path)
+                self._remove_from_index([session_path.name])
                 return None
 
             return session_data
@@ -144,9 +421,11 @@ class SessionManager:
             True if session was deleted, False if it didn't exist
         """
         session_path = self._get_session_path(site, zipcode)
+        self._mem_cache.pop((site, zipcode), None)
 
         if session_path.exists():
-            session_path.unlink()
+            self._unlink_session(session_path)
+            self._remove_from_index([session_path.name])
             return True
 
         return False
@@ -179,24 +458,18 @@ class SessionManager:
         """
         sessions = []
 
-        for session_file in self.cache_dir.glob('*.json'):
-            try:
-                with open(session_file, 'r') as f:
-                    session_data = json.load(f)
-
-                # Filter by site if specified
-                if site and session_data.get('site') != site:
-                    continue
-
-                sessions.append({
-                    'site': session_data.get('site'),
-                    'zipcode': session_data.get('zipcode'),
-                    'created_at': session_data.get('created_at'),
-                    'valid': self.is_session_valid(session_data),
-                })
-            except Exception:
+        for entry in self._load_index().values():
+            # Filter by site if specified
+            if site and entry.get('site') != site:
                 continue
 
+            sessions.append({
+                'site': entry.get('site'),
+                'zipcode': entry.get('zipcode'),
+                'created_at': entry.get('created_at'),
+                'valid': self.is_session_valid(entry),
+            })
+
         return sessions
 
     def cleanup_expired(self) -> int:
@@ -206,20 +479,21 @@ class SessionManager:
         Returns:
             Number of sessions deleted
         """
-        deleted_count = 0
+        expired = []
 
-        for session_file in self.cache_dir.glob('*.json'):
-            try:
-                with open(session_file, 'r') as f:
-                    session_data = json.load(f)
+        for filename, entry in self._load_index().items():
+            if self.is_session_valid(entry):
+                continue
 
-                if not self.is_session_valid(session_data):
-                    session_file.unlink()
-                    deleted_count += 1
+            try:
+                self._unlink_session(self.cache_dir / filename)
+                self._mem_cache.pop((entry.get('site'), entry.get('zipcode')), None)
+                expired.append(filename)
             except Exception:
                 continue
 
-        return deleted_count
+        self._remove_from_index(expired)
+        return len(expired)
 
     def clear_all(self, site: Optional[str] = None) -> int:
         """
@@ -231,22 +505,23 @@ class SessionManager:
         Returns:
             Number of sessions deleted
         """
-        deleted_count = 0
+        deleted = []
 
         pattern = f"{site}_*.json" if site else "*.json"
 
-        for session_file in self.cache_dir.glob(pattern):
+        for session_file in self._session_files(pattern):
             try:
-                session_file.unlink()
-                deleted_count += 1
+                self._unlink_session(session_file)
+                deleted.append(session_file.name)
             except Exception:
                 continue
 
-        return deleted_count
+        self._remove_from_index(deleted)
+        return len(deleted)
 
     def __str__(self) -> str:
         """String representation."""
-        session_count = len(list(self.cache_dir.glob('*.json')))
+        session_count = len(self._load_index())
         return (
             f"SessionManager(cache_dir='{self.cache_dir}', "
             f"sessions={session_count}, max_age={self.max_age.total_seconds()/3600}h)"
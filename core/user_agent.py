@@ -1,7 +1,51 @@
 #!/usr/bin/env python3
 """User agent rotation for avoiding bot detection."""
 import random
-from typing import Optional
+from typing import Dict, Optional, Sequence, Tuple
+
+
+# Browser markers in precedence order: Edge UAs also contain 'Chrome/', and
+# Chrome/Edge UAs also contain 'Safari/', so the first match wins
+_MARKERS: Tuple[Tuple[str, str], ...] = (
+    ('Edg/', 'edge'),
+    ('Chrome/', 'chrome'),
+    ('Firefox/', 'firefox'),
+    ('Safari/', 'safari'),
+)
+
+
+def _browser_type(user_agent: str) -> str:
+    """
+    Determine browser type from user agent string.
+
+    Scans for each marker at most once; no marker is re-checked.
+
+    Args:
+        user_agent: User agent string
+
+    Returns:
+        Browser type ('chrome', 'firefox', 'safari', 'edge', 'unknown')
+    """
+    for marker, browser in _MARKERS:
+        if marker in user_agent:
+            return browser
+    return 'unknown'
+
+
+def _group_by_browser(user_agents: Sequence[str]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Group user agents by browser type.
+
+    Args:
+        user_agents: User agent strings
+
+    Returns:
+        Dictionary mapping browser type to a tuple of its user agents
+    """
+    groups: Dict[str, list] = {}
+    for ua in user_agents:
+        groups.setdefault(_browser_type(ua), []).append(ua)
+    return {browser: tuple(agents) for browser, agents in groups.items()}
 
 
 class UserAgentRotator:
@@ -13,7 +57,7 @@ class UserAgentRotator:
     """
 
     # Pool of realistic user agents (Chrome, Firefox, Safari, Edge)
-    USER_AGENTS = [
+    USER_AGENTS = (
         # Chrome on Windows
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -52,7 +96,7 @@ class UserAgentRotator:
 
         # Edge on Mac
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
-    ]
+    )
 
     # Site-specific user agent preferences
     SITE_PREFERENCES = {
@@ -62,9 +106,13 @@ class UserAgentRotator:
         'amazon': 'firefox',
     }
 
+    # User agents per browser type, computed once at import
+    _BUCKETS = _group_by_browser(USER_AGENTS)
+
     def __init__(self):
         """Initialize user agent rotator."""
         self.last_used = None
+        self._rng = random.Random()
 
     def get_random(self) -> str:
         """
@@ -73,7 +121,7 @@ class UserAgentRotator:
         Returns:
             Random user agent string
         """
-        ua = random.choice(self.USER_AGENTS)
+        ua = self._rng.choice(self.USER_AGENTS)
         self.last_used = ua
         return ua
 
@@ -88,15 +136,11 @@ class UserAgentRotator:
             User agent string suitable for the site
         """
         preference = self.SITE_PREFERENCES.get(site.lower())
+        bucket = self._BUCKETS.get(preference)
 
-        if preference == 'chrome':
-            # Filter to Chrome user agents
-            chrome_agents = [ua for ua in self.USER_AGENTS if 'Chrome/' in ua and 'Edg/' not in ua]
-            ua = random.choice(chrome_agents)
-        elif preference == 'firefox':
-            # Filter to Firefox user agents
-            firefox_agents = [ua for ua in self.USER_AGENTS if 'Firefox/' in ua]
-            ua = random.choice(firefox_agents)
+        if bucket:
+            # Pick from the precomputed user agents for the preferred browser
+            ua = self._rng.choice(bucket)
         else:
             # Default to random
             ua = self.get_random()
@@ -123,16 +167,7 @@ class UserAgentRotator:
         Returns:
             Browser type ('chrome', 'firefox', 'safari', 'edge', 'unknown')
         """
-        if 'Edg/' in user_agent:
-            return 'edge'
-        elif 'Chrome/' in user_agent:
-            return 'chrome'
-        elif 'Firefox/' in user_agent:
-            return 'firefox'
-        elif 'Safari/' in user_agent and 'Chrome/' not in user_agent:
-            return 'safari'
-        else:
-            return 'unknown'
+        return _browser_type(user_agent)
 
     def __str__(self) -> str:
         """String representation."""
@@ -7,8 +7,8 @@ Usage:
 """
 import asyncio
 import argparse
+import math
 import yaml
-import json
 from pathlib import Path
 from typing import List
 
@@ -17,16 +17,26 @@ from core.user_agent import UserAgentRotator
 from core.rate_limiter import RateLimiter
 from core.session_manager import SessionManager
 from scrapers.walmart_scraper import WalmartScraper
-from models.product import Product
-from utils.logger import setup_logger
+from models.product import Product, ProductBatch
+from utils import json_utils
+from utils.logger import setup_logger, skip_record_extras
 
 logger = setup_logger('main', level='INFO')
 
+# libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed site configs, keyed by site name
+CONFIG_CACHE_DIR = Path(__file__).parent / '.cache' / 'config'
+
 
 def load_config(site: str) -> dict:
     """
     Load site configuration from YAML file.
 
+    The parsed config is cached as JSON under .cache/config/ and reused
+    while it is at least as new as the YAML file.
+
     Args:
         site: Site name (e.g., 'walmart')
 
@@ -38,8 +48,24 @@ def load_config(site: str) -> dict:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+    cache_path = CONFIG_CACHE_DIR / f'{site}.json'
+
+    try:
+        if cache_path.stat().st_mtime >= config_path.stat().st_mtime:
+            return json_utils.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
+
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(json_utils.dumps(config))
+    except (OSError, TypeError) as e:
+        logger.warning(f"Failed to cache configuration for {site}: {e}")
+
+    return config
 
 
 async def scrape_site(
@@ -70,9 +96,13 @@ async def scrape_site(
     ua_rotator = UserAgentRotator()
     user_agent = ua_rotator.get_for_site(site)
 
+    # Product pages fetched at once; the browser page pool is sized to match
+    concurrency = config['rate_limiting'].get('concurrency', 4)
+
     browser = BrowserDriver(
         headless=headless,
-        user_agent=user_agent
+        user_agent=user_agent,
+        max_pages=concurrency
     )
 
     rate_limiter = RateLimiter(
@@ -111,12 +141,11 @@ async def scrape_site(
         product_urls = await scraper.search_products(query, max_results=max_results)
         logger.info(f"Found {len(product_urls)} product URLs")
 
-        # Scrape product details
-        for i, url in enumerate(product_urls, 1):
-            logger.info(f"Scraping product {i}/{len(product_urls)}")
-            product = await scraper.get_product_details(url)
-            if product:
-                products.append(product)
+        # Scrape product details concurrently; the rate limiter still
+        # spaces out the requests
+        logger.info(f"Scraping {len(product_urls)} products ({concurrency} at a time)")
+        results = await scraper.fetch_many(product_urls, concurrency=concurrency)
+        products = [product for product in results if product]
 
         logger.info(f"Successfully scraped {len(products)} products")
 
@@ -135,20 +164,28 @@ def save_products(products: List[Product], output_file: str):
     """
     Save products to JSON file.
 
+    Products are serialized straight from the dataclasses and written one
+    at a time, so only one encoded product is held in memory at once.
+
     Args:
         products: List of products
         output_file: Output file path
     """
-    data = [p.to_dict() for p in products]
-
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(b'[')
+        for i, product in enumerate(products):
+            f.write(b',\n' if i else b'\n')
+            f.write(json_utils.dumps(product, indent=True))
+        f.write(b'\n]\n' if products else b']\n')
 
     logger.info(f"Saved {len(products)} products to {output_file}")
 
 
 def main():
     """Main entry point."""
+    # Our log format has no thread/process/caller fields
+    skip_record_extras()
+
     parser = argparse.ArgumentParser(
         description='Multi-site retail webscraper for product pricing'
     )
@@ -182,7 +219,7 @@ def main():
     parser.add_argument(
         '--output',
         default='products.json',
-        help='Output file path (default: products.json)'
+        help='Output file path; a .parquet path writes Parquet (default: products.json)'
     )
 
     parser.add_argument(
@@ -208,17 +245,33 @@ def main():
 
     # Save results
     if products:
-        save_products(products, args.output)
+        batch = ProductBatch(products)
+
+        invalid = batch.validate().count(False)
+        if invalid:
+            logger.warning(f"{invalid} of {len(batch)} products failed validation")
+
+        if args.output.endswith('.parquet'):
+            batch.write_parquet(args.output)
+            logger.info(f"Saved {len(batch)} products to {args.output}")
+        else:
+            save_products(products, args.output)
         logger.info("="*80)
         logger.info(f"Scraping complete! Found {len(products)} products")
         logger.info("="*80)
 
-        # Print summary
-        for i, product in enumerate(products, 1):
-            print(f"\n{i}. {product.name}")
-            print(f"   Price: ${product.current_price:.2f}" if product.current_price else "   Price: N/A")
-            print(f"   In Stock: {product.in_stock}")
-            print(f"   URL: {product.url}")
+        # Print summary from the columns it needs (NaN marks a missing price)
+        summary = zip(
+            batch.column('name'),
+            batch.column('current_price'),
+            batch.column('in_stock'),
+            batch.column('url'),
+        )
+        for i, (name, price, in_stock, url) in enumerate(summary, 1):
+            print(f"\n{i}. {name}")
+            print(f"   Price: ${price:.2f}" if price and not math.isnan(price) else "   Price: N/A")
+            print(f"   In Stock: {in_stock}")
+            print(f"   URL: {url}")
     else:
         logger.warning("No products were scraped")
 
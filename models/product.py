@@ -1,11 +1,23 @@
 #!/usr/bin/env python3
 """Product data model for webscraper."""
-from dataclasses import dataclass, asdict, field
-from typing import Optional, Dict, List
+import math
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional, Dict, Iterable, Iterator, List
 from datetime import datetime
 
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
-@dataclass
+
+# Product.__str__ labels for each in_stock state
+_STOCK_STRS = {True: "In Stock", False: "Out of Stock", None: "Unknown"}
+
+
+@dataclass(slots=True)
 class Product:
     """
     Product data model representing scraped product information.
@@ -19,7 +31,7 @@ class Product:
     url: str
     site: str
     zipcode: str
-    scraped_at: datetime = field(default_factory=datetime.now)
+    scraped_at: Optional[datetime] = None  # Set by the scraper; to_dict() falls back to now
 
     # Pricing information
     current_price: Optional[float] = None
@@ -66,9 +78,15 @@ class Product:
         Returns:
             Dictionary representation of product with datetime serialized.
         """
-        data = asdict(self)
+        # Read fields directly instead of dataclasses.asdict(), which
+        # deep-copies every value; only the two containers need copying
+        data = {name: getattr(self, name) for name in _PRODUCT_FIELDS}
         # Serialize datetime
-        data['scraped_at'] = self.scraped_at.isoformat()
+        data['scraped_at'] = (self.scraped_at or datetime.now()).isoformat()
+        if self.specs is not None:
+            data['specs'] = dict(self.specs)
+        if self.image_urls is not None:
+            data['image_urls'] = list(self.image_urls)
         return data
 
     def validate(self) -> bool:
@@ -78,35 +96,21 @@ class Product:
         Returns:
             True if product has all required fields with valid values.
         """
-        # Check required fields
-        if not self.name or not self.url or not self.site or not self.zipcode:
-            return False
-
-        # Validate price if present
-        if self.current_price is not None and self.current_price < 0:
-            return False
-
-        if self.original_price is not None and self.original_price < 0:
-            return False
-
-        # Validate rating if present
-        if self.rating_avg is not None and not (0 <= self.rating_avg <= 5):
-            return False
-
-        if self.rating_count is not None and self.rating_count < 0:
-            return False
-
-        # Validate quantity if present
-        if self.quantity_available is not None and self.quantity_available < 0:
-            return False
-
-        return True
+        return bool(
+            # Required fields
+            self.name and self.url and self.site and self.zipcode
+            # Prices, rating and quantity are optional but must be in range
+            and (self.current_price is None or self.current_price >= 0)
+            and (self.original_price is None or self.original_price >= 0)
+            and (self.rating_avg is None or 0 <= self.rating_avg <= 5)
+            and (self.rating_count is None or self.rating_count >= 0)
+            and (self.quantity_available is None or self.quantity_available >= 0)
+        )
 
     def __str__(self) -> str:
         """String representation of product."""
         price_str = f"${self.current_price:.2f}" if self.current_price else "N/A"
-        stock_str = "In Stock" if self.in_stock else "Out of Stock" if self.in_stock is False else "Unknown"
-        return f"{self.name} - {price_str} ({stock_str}) [{self.site}]"
+        return f"{self.name} - {price_str} ({_STOCK_STRS[self.in_stock]}) [{self.site}]"
 
     def __repr__(self) -> str:
         """Detailed representation of product."""
@@ -116,7 +120,11 @@ class Product:
         )
 
 
-@dataclass
+# Product field names in declaration order, used by Product.to_dict()
+_PRODUCT_FIELDS = tuple(f.name for f in fields(Product))
+
+
+@dataclass(slots=True)
 class ScrapeResult:
     """
     Container for scrape results with metadata.
@@ -153,3 +161,219 @@ class ScrapeResult:
             'started_at': self.started_at.isoformat(),
             'completed_at': self.completed_at.isoformat() if self.completed_at else None,
         }
+
+
+# ProductBatch column storage: optional floats are kept in array('d') and
+# optional ints in array('q'), each with a null mask marking None. Missing
+# slots hold NaN (floats) or 0 (ints) so the arrays stay dense.
+_FLOAT_COLUMNS = frozenset({
+    'current_price', 'original_price', 'discount_percent', 'rating_avg', 'shipping_cost',
+})
+_INT_COLUMNS = frozenset({'quantity_available', 'rating_count', 'delivery_days'})
+
+# Arrow types for ProductBatch.to_arrow() columns that can't be inferred
+# reliably from the values (e.g. when every value is None)
+_ARROW_TYPES = {
+    'scraped_at': 'timestamp',
+    'in_stock': 'bool',
+    'free_shipping': 'bool',
+    'specs': 'map',
+    'image_urls': 'list',
+}
+
+
+class ProductBatch:
+    """
+    Column-oriented (structure of arrays) container for many products.
+
+    Each Product field is stored as one column in columns[name]: numeric
+    fields as compact typed arrays, everything else as a list. Code that
+    scans one or two fields across a result set (summaries, filters,
+    validation) reads a flat column instead of visiting every Product.
+
+    Numeric columns have a null mask in nulls[name] (a bytearray, 1 where
+    the value is None), so real values such as NaN or -1 are kept apart
+    from missing ones. Missing slots read as NaN in float columns and 0 in
+    int columns; use to_products() or to_records() to get None back.
+    """
+
+    def __init__(self, products: Iterable[Product] = ()):
+        """
+        Initialize product batch.
+
+        Args:
+            products: Products to add to the batch
+        """
+        self.columns: Dict[str, Any] = {}
+        self.nulls: Dict[str, bytearray] = {}
+        for name in _PRODUCT_FIELDS:
+            if name in _FLOAT_COLUMNS:
+                self.columns[name] = array('d')
+                self.nulls[name] = bytearray()
+            elif name in _INT_COLUMNS:
+                self.columns[name] = array('q')
+                self.nulls[name] = bytearray()
+            else:
+                self.columns[name] = []
+
+        for product in products:
+            self.append(product)
+
+    def append(self, product: Product) -> None:
+        """
+        Add a product to the end of the batch.
+
+        Args:
+            product: Product to add
+        """
+        for name, column in self.columns.items():
+            value = getattr(product, name)
+            if name in self.nulls:
+                self.nulls[name].append(value is None)
+                if value is None:
+                    value = math.nan if name in _FLOAT_COLUMNS else 0
+            column.append(value)
+
+    def column(self, name: str) -> Any:
+        """
+        Get the storage for one field.
+
+        Args:
+            name: Product field name
+
+        Returns:
+            The field's column (array or list), one entry per product;
+            see nulls for which numeric entries are missing
+        """
+        return self.columns[name]
+
+    def validate(self) -> List[bool]:
+        """
+        Validate every product in the batch, column by column.
+
+        Applies the same checks as Product.validate() in one pass over the
+        relevant columns, without building Product objects.
+
+        Returns:
+            List of booleans, True where the product at that index is valid
+        """
+        c = self.columns
+        n = self.nulls
+        rows = zip(
+            c['name'], c['url'], c['site'], c['zipcode'],
+            c['current_price'], n['current_price'],
+            c['original_price'], n['original_price'],
+            c['rating_avg'], n['rating_avg'],
+            c['rating_count'], n['rating_count'],
+            c['quantity_available'], n['quantity_available'],
+        )
+        # A NaN that isn't masked as missing fails its range check, as it
+        # does in Product.validate()
+        return [
+            bool(
+                name and url and site and zipcode
+                and (price_null or price >= 0)
+                and (original_null or original >= 0)
+                and (rating_null or 0 <= rating <= 5)
+                and (count_null or count >= 0)
+                and (quantity_null or quantity >= 0)
+            )
+            for (
+                name, url, site, zipcode, price, price_null, original, original_null,
+                rating, rating_null, count, count_null, quantity, quantity_null,
+            ) in rows
+        ]
+
+    def _row(self, i: int) -> Dict[str, Any]:
+        """Rebuild the field values of one product, restoring None."""
+        nulls = self.nulls
+        return {
+            name: None if name in nulls and nulls[name][i] else column[i]
+            for name, column in self.columns.items()
+        }
+
+    def to_products(self) -> List[Product]:
+        """
+        Convert the batch back to Product objects.
+
+        Returns:
+            List of products in batch order
+        """
+        return [Product(**self._row(i)) for i in range(len(self))]
+
+    def to_records(self) -> List[Dict]:
+        """
+        Convert the batch to product dictionaries.
+
+        Returns:
+            List of dictionaries in the same format as Product.to_dict()
+        """
+        return [product.to_dict() for product in self.to_products()]
+
+    def to_arrow(self) -> 'pyarrow.Table':
+        """
+        Convert the batch to a pyarrow Table, one column per field.
+
+        Missing numeric values become nulls, taken from the null masks.
+
+        Returns:
+            pyarrow Table in batch order
+
+        Raises:
+            RuntimeError: If pyarrow is not installed
+        """
+        if pyarrow is None:
+            raise RuntimeError("pyarrow is not installed")
+
+        types = {
+            'timestamp': pyarrow.timestamp('us'),
+            'bool': pyarrow.bool_(),
+            'map': pyarrow.map_(pyarrow.string(), pyarrow.string()),
+            'list': pyarrow.list_(pyarrow.string()),
+        }
+
+        arrays = {}
+        for name, column in self.columns.items():
+            if name in self.nulls:
+                mask = pyarrow.array(memoryview(self.nulls[name]).cast('?'), type=pyarrow.bool_())
+                arrays[name] = pyarrow.array(
+                    memoryview(column),
+                    type=pyarrow.float64() if name in _FLOAT_COLUMNS else pyarrow.int64(),
+                    mask=mask,
+                )
+            elif name == 'specs':
+                arrays[name] = pyarrow.array(
+                    [list(specs.items()) if specs is not None else None for specs in column],
+                    type=types['map'],
+                )
+            elif name in _ARROW_TYPES:
+                arrays[name] = pyarrow.array(column, type=types[_ARROW_TYPES[name]])
+            else:
+                arrays[name] = pyarrow.array(column, type=pyarrow.string())
+
+        return pyarrow.table(arrays)
+
+    def write_parquet(self, path: str) -> None:
+        """
+        Write the batch to a Parquet file.
+
+        Args:
+            path: Output file path
+
+        Raises:
+            RuntimeError: If pyarrow is not installed
+        """
+        table = self.to_arrow()
+        pyarrow.parquet.write_table(table, path)
+
+    def __len__(self) -> int:
+        """Number of products in the batch."""
+        return len(self.columns['name'])
+
+    def __iter__(self) -> Iterator[Product]:
+        """Iterate over the batch as Product objects."""
+        return iter(self.to_products())
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"ProductBatch(products={len(self)})"
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Read product data from a page's schema.org JSON-LD record."""
+from typing import Any, Dict, Iterator, Optional
+
+from parsers.selector_engine import SelectorEngine
+from utils import json_utils
+from utils.normalizers import normalize_price, normalize_rating, normalize_count
+
+
+_SCRIPTS = SelectorEngine.compile(('script[type="application/ld+json"]',))
+
+# in_stock for each schema.org ItemAvailability value
+_AVAILABILITY = {
+    'InStock': True,
+    'InStoreOnly': True,
+    'OnlineOnly': True,
+    'LimitedAvailability': True,
+    'PreOrder': False,
+    'OutOfStock': False,
+    'SoldOut': False,
+    'Discontinued': False,
+}
+
+
+def _nodes(data: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every top-level JSON-LD object, including @graph members.
+
+    Args:
+        data: Parsed contents of one JSON-LD script
+
+    Yields:
+        JSON-LD objects
+    """
+    if isinstance(data, list):
+        for item in data:
+            yield from _nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        yield from _nodes(data.get('@graph'))
+
+
+def _is_product(node: Dict[str, Any]) -> bool:
+    """Check whether a JSON-LD object is a schema.org Product."""
+    kind = node.get('@type')
+    return kind == 'Product' or (isinstance(kind, list) and 'Product' in kind)
+
+
+def _first(value: Any) -> Any:
+    """Get the first item of a JSON-LD value that may be a list."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _name(value: Any) -> Optional[str]:
+    """Get a name that may be given as a string or a Thing object."""
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get('name')
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+
+def find_product(engine: SelectorEngine) -> Optional[Dict[str, Any]]:
+    """
+    Find the schema.org Product object embedded in a page.
+
+    Scripts that aren't valid JSON are skipped.
+
+    Args:
+        engine: Selector engine over the page
+
+    Returns:
+        The first Product object, or None if the page has none
+    """
+    for script in engine.select_many_compiled(_SCRIPTS):
+        try:
+            data = json_utils.loads(script)
+        except ValueError:
+            continue
+
+        for node in _nodes(data):
+            if _is_product(node):
+                return node
+
+    return None
+
+
+def product_fields(engine: SelectorEngine) -> Optional[Dict[str, Any]]:
+    """
+    Read Product fields from a page's JSON-LD record.
+
+    Only fields present in the record are returned: name, current_price,
+    currency, in_stock, stock_status_text, rating_avg, rating_count, brand,
+    model, sku, upc, description and image_urls.
+
+    Args:
+        engine: Selector engine over the page
+
+    Returns:
+        Dictionary of Product keyword arguments, or None if the page has
+        no Product record with a name
+    """
+    product = find_product(engine)
+    if product is None:
+        return None
+
+    name = _name(product.get('name'))
+    if not name:
+        return None
+
+    fields: Dict[str, Any] = {'name': name}
+
+    offer = _first(product.get('offers'))
+    if isinstance(offer, dict):
+        price = offer.get('price', offer.get('lowPrice'))
+        if price is not None:
+            fields['current_price'] = normalize_price(str(price))
+        if offer.get('priceCurrency'):
+            fields['currency'] = offer['priceCurrency']
+
+        availability = offer.get('availability')
+        if availability:
+            # e.g. "https://schema.org/InStock"
+            status = str(availability).rsplit('/', 1)[-1]
+            fields['in_stock'] = _AVAILABILITY.get(status)
+            fields['stock_status_text'] = status
+
+    rating = product.get('aggregateRating')
+    if isinstance(rating, dict):
+        if rating.get('ratingValue') is not None:
+            fields['rating_avg'] = normalize_rating(str(rating['ratingValue']))
+        count = rating.get('reviewCount', rating.get('ratingCount'))
+        if count is not None:
+            fields['rating_count'] = normalize_count(str(count))
+
+    for key in ('brand', 'model', 'sku'):
+        value = _name(product.get(key))
+        if value:
+            fields[key] = value
+
+    upc = product.get('gtin12') or product.get('gtin')
+    if upc:
+        fields['upc'] = str(upc)
+
+    if product.get('description'):
+        fields['description'] = str(product['description']).strip()
+
+    images = product.get('image')
+    if images:
+        if not isinstance(images, list):
+            images = [images]
+        urls = [
+            image.get('url') if isinstance(image, dict) else image
+            for image in images
+        ]
+        urls = [url for url in urls if isinstance(url, str) and url]
+        if urls:
+            fields['image_urls'] = urls
+
+    return fields
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Selector engine backed by selectolax's Lexbor HTML parser."""
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple, Union
+
+from lxml.cssselect import CSSSelector
+
+from parsers.selector_engine import SelectorEngine
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+except ImportError:
+    LexborHTMLParser = None
+    SelectolaxError = None
+
+
+@lru_cache(maxsize=512)
+def _supported(css: str) -> bool:
+    """
+    Check once whether Lexbor can parse a CSS selector.
+
+    compile() validates selectors with cssselect, whose dialect differs
+    slightly from Lexbor's (e.g. cssselect's :contains()).
+
+    Args:
+        css: CSS selector string
+
+    Returns:
+        True if Lexbor accepts the selector
+    """
+    try:
+        LexborHTMLParser('<html></html>').css(css)
+    except SelectolaxError:
+        return False
+    return True
+
+
+class LexborSelectorEngine(SelectorEngine):
+    """
+    SelectorEngine variant that parses and queries pages with Lexbor.
+
+    Lexbor parses large pages several times faster than lxml. Selectors
+    are still compiled with SelectorEngine.compile() so callers work with
+    either engine; results match the lxml engine (text is the element's
+    full text, stripped). Use parsers.selector_engine.create_engine() to
+    pick this engine when selectolax is installed.
+    """
+
+    def __init__(self, html: Union[str, bytes]):
+        """
+        Initialize selector engine with HTML content.
+
+        Args:
+            html: HTML content to parse, as str or UTF-8 bytes
+
+        Raises:
+            RuntimeError: If selectolax is not installed
+        """
+        if LexborHTMLParser is None:
+            raise RuntimeError("selectolax is not installed")
+        self._init(LexborHTMLParser(html), html)
+
+    def select_one_compiled(
+        self,
+        compiled: Tuple[CSSSelector, ...],
+        attr: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Try precompiled selectors and return first match.
+
+        Args:
+            compiled: Selectors from compile()
+            attr: Optional attribute to extract (e.g., 'href', 'src')
+
+        Returns:
+            Extracted text or attribute value, or None if no match found
+        """
+        for selector in compiled:
+            if not _supported(selector.css):
+                continue
+
+            node = self.tree.css_first(selector.css)
+            if node is not None:
+                if attr:
+                    value = (node.attributes.get(attr) or '').strip()
+                    if value:
+                        return value
+                else:
+                    text = node.text().strip()
+                    if text:
+                        return text
+
+        return None
+
+    def select_fields_compiled(
+        self,
+        fields: Dict[str, Tuple[CSSSelector, ...]],
+        attr: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Extract several fields at once from their precompiled selectors.
+
+        Lexbor has no union query that reports which selector matched,
+        so each field is looked up with select_one_compiled().
+
+        Args:
+            fields: Field name -> selectors from compile()
+            attr: Optional attribute to extract (e.g., 'href', 'src')
+
+        Returns:
+            Field name -> extracted text or attribute value (None if no match)
+        """
+        return {
+            name: self.select_one_compiled(compiled, attr)
+            for name, compiled in fields.items()
+        }
+
+    def select_many_compiled(
+        self,
+        compiled: Tuple[CSSSelector, ...],
+        attr: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Select multiple elements with precompiled selectors.
+
+        Args:
+            compiled: Selectors from compile()
+            attr: Optional attribute to extract
+            limit: Maximum number of results to return
+
+        Returns:
+            List of extracted values
+        """
+        results = []
+
+        for selector in compiled:
+            if not _supported(selector.css):
+                continue
+
+            for node in self.tree.css(selector.css):
+                if limit and len(results) >= limit:
+                    return results
+
+                if attr:
+                    value = (node.attributes.get(attr) or '').strip()
+                    if value:
+                        results.append(value)
+                else:
+                    text = node.text().strip()
+                    if text:
+                        results.append(text)
+
+            if results:
+                # Found results with this selector, stop trying others
+                break
+
+        return results
+
+    def extract_table_compiled(self, compiled: Tuple[CSSSelector, ...]) -> Dict[str, str]:
+        """
+        Extract key-value pairs from a table using precompiled selectors.
+
+        Args:
+            compiled: Table selectors from compile()
+
+        Returns:
+            Dictionary of key-value pairs
+        """
+        specs = {}
+
+        for selector in compiled:
+            if not _supported(selector.css):
+                continue
+
+            table = self.tree.css_first(selector.css)
+            if table is None:
+                continue
+
+            for row in table.css('tr'):
+                # First two th/td cells that are direct children of the row
+                cells = [c for c in row.iter() if c.tag in ('th', 'td')][:2]
+                if len(cells) == 2:
+                    key = cells[0].text().strip()
+                    value = cells[1].text().strip()
+                    if key and value:
+                        specs[key] = value
+
+            # If we found any specs, return them
+            if specs:
+                break
+
+        return specs
+
+    def _extract_page_text(self) -> str:
+        """Get the text content of the whole document."""
+        root = self.tree.root
+        return root.text() if root is not None else ''
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"LexborSelectorEngine(html_length={len(self._html)})"
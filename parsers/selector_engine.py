@@ -1,7 +1,154 @@
 #!/usr/bin/env python3
 """Selector engine for parsing HTML with multiple fallback selectors."""
-from typing import List, Optional, Dict
-from bs4 import BeautifulSoup
+import threading
+from functools import lru_cache
+from typing import List, Optional, Dict, Sequence, Tuple, Union
+
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector, SelectorError
+
+
+# lxml parsers must not be shared between threads, so keep one per thread
+_parsers = threading.local()
+
+# First two header/data cells that are direct children of a table row
+_ROW_CELLS = etree.XPath('(./th|./td)[position() <= 2]')
+
+# First match of each selector, recorded by select_fields_compiled()
+_FIELDS_NS = 'urn:webscraper:fields'
+_first_matches = threading.local()
+
+
+def _record_first_match(context, index: float) -> bool:
+    """XPath extension function noting the element matched by selector #index."""
+    _first_matches.found[int(index)] = context.context_node
+    return True
+
+
+@lru_cache(maxsize=512)
+def _css(selector: str) -> CSSSelector:
+    """
+    Compile a CSS selector to XPath once and reuse it across pages.
+
+    Args:
+        selector: CSS selector string
+
+    Returns:
+        Compiled selector, callable on an lxml element
+    """
+    return CSSSelector(selector, translator='html')
+
+
+@lru_cache(maxsize=512)
+def _css_window(selector: str) -> etree.XPath:
+    """
+    Compile a CSS selector into an XPath returning a slice of its matches.
+
+    Call the result with start/stop variables to get matches start+1
+    through stop (document order) without building the full match list.
+
+    Args:
+        selector: CSS selector string
+
+    Returns:
+        Compiled XPath, callable as xpath(tree, start=0, stop=n)
+    """
+    return etree.XPath(
+        f"({_css(selector).path})[position() > $start and position() <= $stop]"
+    )
+
+
+@lru_cache(maxsize=64)
+def _first_matches_xpath(selectors: Tuple[str, ...]) -> etree.XPath:
+    """
+    Compile one XPath union yielding the first match of every selector.
+
+    Each branch tags its match through _record_first_match(), so a single
+    evaluation reports which selector found which element.
+
+    Args:
+        selectors: CSS selector strings; a branch's index is its position
+
+    Returns:
+        Compiled XPath, callable on an lxml element
+    """
+    return etree.XPath(
+        ' | '.join(
+            f"({_css(selector).path})[1][f:hit({index})]"
+            for index, selector in enumerate(selectors)
+        ),
+        namespaces={'f': _FIELDS_NS},
+        extensions={(_FIELDS_NS, 'hit'): _record_first_match},
+    )
+
+
+@lru_cache(maxsize=512)
+def _css_attr(selector: str, attr: str) -> etree.XPath:
+    """
+    Compile a CSS selector into an XPath returning an attribute of its matches.
+
+    Values are read by libxml2 and returned as plain strings, without
+    creating element proxies; matches lacking the attribute are skipped.
+
+    Args:
+        selector: CSS selector string
+        attr: Attribute name (e.g. 'href', 'src')
+
+    Returns:
+        Compiled XPath, callable on an lxml element
+    """
+    return etree.XPath(f"({_css(selector).path})/@{attr}", smart_strings=False)
+
+
+@lru_cache(maxsize=512)
+def _css_attr_window(selector: str, attr: str) -> etree.XPath:
+    """
+    Like _css_attr(), but returning a slice of the attribute values.
+
+    Args:
+        selector: CSS selector string
+        attr: Attribute name (e.g. 'href', 'src')
+
+    Returns:
+        Compiled XPath, callable as xpath(tree, start=0, stop=n)
+    """
+    return etree.XPath(
+        f"(({_css(selector).path})/@{attr})[position() > $start and position() <= $stop]",
+        smart_strings=False,
+    )
+
+
+def parse_html(html: Union[str, bytes]) -> lxml.html.HtmlElement:
+    """
+    Parse an HTML document into an lxml tree.
+
+    Uses an explicit per-thread HTMLParser, which lxml runs without holding
+    the GIL, so pages parsed in worker threads parse in parallel. Bytes
+    (e.g. a raw HTTP response body) are parsed as UTF-8 without being
+    decoded to str first.
+
+    Args:
+        html: HTML content to parse, as str or UTF-8 bytes
+
+    Returns:
+        Root <html> element of the document
+    """
+    if isinstance(html, bytes):
+        parser = getattr(_parsers, 'html_utf8', None)
+        if parser is None:
+            # Without an explicit encoding lxml would guess (often Latin-1)
+            parser = _parsers.html_utf8 = lxml.html.HTMLParser(encoding='utf-8')
+    else:
+        parser = getattr(_parsers, 'html', None)
+        if parser is None:
+            parser = _parsers.html = lxml.html.HTMLParser()
+
+    try:
+        return lxml.html.document_fromstring(html, parser=parser)
+    except etree.ParserError:
+        # Empty or whitespace-only document
+        return lxml.html.document_fromstring('<html></html>', parser=parser)
 
 
 class SelectorEngine:
@@ -12,20 +159,82 @@ class SelectorEngine:
     - Multiple selector fallbacks
     - Attribute extraction
     - Text normalization
+
+    Fallback lists that are used for every page should be compiled once
+    with compile() and passed to the *_compiled methods; the plain methods
+    compile (and cache) their selector lists on each call.
+
+    A document that is already parsed (see parse_html()) can be wrapped
+    with from_tree() instead of being parsed again.
     """
 
-    def __init__(self, html: str):
+    def __init__(self, html: Union[str, bytes]):
         """
         Initialize selector engine with HTML content.
 
         Args:
-            html: HTML content to parse
+            html: HTML content to parse, as str or UTF-8 bytes
+        """
+        self._init(parse_html(html), html)
+
+    def _init(self, tree: lxml.html.HtmlElement, html: Union[str, bytes, None]) -> None:
+        """Set up engine state for a parsed document."""
+        self.tree = tree
+        self._html = html
+
+        # Page text for has_text(), extracted on first use
+        self._page_text: Optional[str] = None
+        self._page_text_lower: Optional[str] = None
+
+    @classmethod
+    def from_tree(
+        cls,
+        tree: lxml.html.HtmlElement,
+        html: Union[str, bytes, None] = None
+    ) -> 'SelectorEngine':
+        """
+        Create a selector engine over an already parsed document.
+
+        Args:
+            tree: Document root from parse_html()
+            html: Source HTML, if available (used by has_text())
+
+        Returns:
+            SelectorEngine querying the given tree
         """
-        self.soup = BeautifulSoup(html, 'lxml')
+        engine = cls.__new__(cls)
+        engine._init(tree, html)
+        return engine
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile(selectors: Tuple[str, ...]) -> Tuple[CSSSelector, ...]:
+        """
+        Compile a fallback list of CSS selectors for repeated use.
+
+        Selectors lxml can't evaluate (e.g. Playwright-only pseudo-classes
+        such as :has-text()) are dropped, as they could never match. All
+        selector errors surface here, so querying with the result doesn't
+        need per-selector error handling.
+
+        Args:
+            selectors: Tuple of CSS selectors, in fallback order
+
+        Returns:
+            Tuple of compiled selectors, in the same order
+        """
+        compiled = []
+        for selector in selectors:
+            try:
+                _css_window(selector)
+            except (SelectorError, etree.XPathSyntaxError):
+                continue
+            compiled.append(_css(selector))
+        return tuple(compiled)
 
     def select_one(
         self,
-        selectors: List[str],
+        selectors: Sequence[str],
         attr: Optional[str] = None
     ) -> Optional[str]:
         """
@@ -38,28 +247,79 @@ class SelectorEngine:
         Returns:
             Extracted text or attribute value, or None if no match found
         """
-        for selector in selectors:
-            try:
-                element = self.soup.select_one(selector)
-                if element:
-                    if attr:
-                        # Extract attribute
-                        value = element.get(attr)
-                        if value:
-                            return str(value).strip()
-                    else:
-                        # Extract text content
-                        text = element.get_text(strip=True)
-                        if text:
-                            return text
-            except Exception:
-                continue
+        return self.select_one_compiled(self.compile(tuple(selectors)), attr)
+
+    def select_one_compiled(
+        self,
+        compiled: Tuple[CSSSelector, ...],
+        attr: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Try precompiled selectors and return first match.
+
+        Args:
+            compiled: Selectors from compile()
+            attr: Optional attribute to extract (e.g., 'href', 'src')
+
+        Returns:
+            Extracted text or attribute value, or None if no match found
+        """
+        for selector in compiled:
+            matches = _css_window(selector.css)(self.tree, start=0, stop=1)
+            if matches:
+                value = self._value(matches[0], attr)
+                if value:
+                    return value
 
         return None
 
+    def select_fields_compiled(
+        self,
+        fields: Dict[str, Tuple[CSSSelector, ...]],
+        attr: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Extract several fields at once from their precompiled selectors.
+
+        Equivalent to calling select_one_compiled() for each field, but
+        the whole page is queried in one XPath evaluation.
+
+        Args:
+            fields: Field name -> selectors from compile()
+            attr: Optional attribute to extract (e.g., 'href', 'src')
+
+        Returns:
+            Field name -> extracted text or attribute value (None if no match)
+        """
+        index: Dict[str, int] = {}
+        for compiled in fields.values():
+            for selector in compiled:
+                index.setdefault(selector.css, len(index))
+
+        values = dict.fromkeys(fields)
+        if not index:
+            return values
+
+        _first_matches.found = found = {}
+        try:
+            _first_matches_xpath(tuple(index))(self.tree)
+        finally:
+            del _first_matches.found
+
+        for name, compiled in fields.items():
+            for selector in compiled:
+                element = found.get(index[selector.css])
+                if element is not None:
+                    value = self._value(element, attr)
+                    if value:
+                        values[name] = value
+                        break
+
+        return values
+
     def select_many(
         self,
-        selectors: List[str],
+        selectors: Sequence[str],
         attr: Optional[str] = None,
         limit: Optional[int] = None
     ) -> List[str]:
@@ -71,91 +331,200 @@ class SelectorEngine:
             attr: Optional attribute to extract
             limit: Maximum number of results to return
 
+        Returns:
+            List of extracted values
+        """
+        return self.select_many_compiled(self.compile(tuple(selectors)), attr, limit)
+
+    def select_many_compiled(
+        self,
+        compiled: Tuple[CSSSelector, ...],
+        attr: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Select multiple elements with precompiled selectors.
+
+        Args:
+            compiled: Selectors from compile()
+            attr: Optional attribute to extract
+            limit: Maximum number of results to return
+
         Returns:
             List of extracted values
         """
         results = []
 
-        for selector in selectors:
-            try:
-                elements = self.soup.select(selector)
-                if elements:
-                    for element in elements:
-                        if limit and len(results) >= limit:
-                            return results
-
-                        if attr:
-                            value = element.get(attr)
-                            if value:
-                                results.append(str(value).strip())
-                        else:
-                            text = element.get_text(strip=True)
-                            if text:
-                                results.append(text)
-
-                    if results:
-                        # Found results with this selector, stop trying others
+        for selector in compiled:
+            if limit:
+                # Fetch only as many matches as are still needed;
+                # matches without a value may require another window
+                if attr:
+                    window = _css_attr_window(selector.css, attr)
+                else:
+                    window = _css_window(selector.css)
+                start = 0
+                while len(results) < limit:
+                    wanted = limit - len(results)
+                    matches = window(self.tree, start=start, stop=start + wanted)
+                    self._collect(matches, attr, results)
+                    if len(matches) < wanted:
                         break
-            except Exception:
-                continue
+                    start += wanted
+            elif attr:
+                self._collect(_css_attr(selector.css, attr)(self.tree), attr, results)
+            else:
+                self._collect(selector(self.tree), None, results)
+
+            if results:
+                # Found results with this selector, stop trying others
+                break
 
         return results
 
-    def extract_table(self, selectors: List[str]) -> Dict[str, str]:
+    @staticmethod
+    def _collect(matches: list, attr: Optional[str], results: List[str]) -> None:
+        """
+        Append the non-empty text of each element, or each attribute value.
+
+        Args:
+            matches: Matched elements, or attribute values if attr is set
+            attr: Attribute the values were read from, if any
+            results: List to append values to
+        """
+        for match in matches:
+            value = match.strip() if attr else match.text_content().strip()
+            if value:
+                results.append(value)
+
+    @staticmethod
+    def _value(element: lxml.html.HtmlElement, attr: Optional[str]) -> Optional[str]:
+        """
+        Get the stripped text or attribute value of an element.
+
+        Args:
+            element: Matched element
+            attr: Optional attribute to extract
+
+        Returns:
+            Extracted value (possibly empty), or None if the attribute is missing
+        """
+        if attr:
+            value = element.get(attr)
+            return str(value).strip() if value else None
+        return element.text_content().strip()
+
+    def extract_table(self, selectors: Sequence[str]) -> Dict[str, str]:
         """
         Extract key-value pairs from a table (e.g., product specifications).
 
         Args:
             selectors: List of CSS selectors for table elements
 
+        Returns:
+            Dictionary of key-value pairs
+        """
+        return self.extract_table_compiled(self.compile(tuple(selectors)))
+
+    def extract_table_compiled(self, compiled: Tuple[CSSSelector, ...]) -> Dict[str, str]:
+        """
+        Extract key-value pairs from a table using precompiled selectors.
+
+        Args:
+            compiled: Table selectors from compile()
+
         Returns:
             Dictionary of key-value pairs
         """
         specs = {}
 
-        for selector in selectors:
-            try:
-                table = self.soup.select_one(selector)
-                if not table:
-                    continue
-
-                # Try to find rows
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['th', 'td'])
-                    if len(cells) >= 2:
-                        key = cells[0].get_text(strip=True)
-                        value = cells[1].get_text(strip=True)
-                        if key and value:
-                            specs[key] = value
-
-                # If we found any specs, return them
-                if specs:
-                    break
-
-            except Exception:
+        for selector in compiled:
+            matches = _css_window(selector.css)(self.tree, start=0, stop=1)
+            if not matches:
                 continue
+            table = matches[0]
+
+            # Walk rows lazily; only the first two cells of each are used
+            for row in table.iter('tr'):
+                cells = _ROW_CELLS(row)
+                if len(cells) == 2:
+                    key = cells[0].text_content().strip()
+                    value = cells[1].text_content().strip()
+                    if key and value:
+                        specs[key] = value
+
+            # If we found any specs, return them
+            if specs:
+                break
 
         return specs
 
-    def has_text(self, text: str, case_sensitive: bool = False) -> bool:
+    def has_text(
+        self,
+        text: str,
+        case_sensitive: bool = False,
+        strict: bool = False
+    ) -> bool:
         """
         Check if HTML contains specific text.
 
+        Case-sensitive checks search the raw HTML source rather than the
+        extracted page text, so they can also match inside tags, attribute
+        values or scripts. Pass strict=True to search visible text only.
+        Engines created by from_tree() without the source always search
+        the page text.
+
         Args:
             text: Text to search for
             case_sensitive: Whether search is case sensitive
+            strict: Search extracted page text instead of raw HTML
+                (only affects case-sensitive checks)
 
         Returns:
             True if text is found, False otherwise
         """
-        page_text = self.soup.get_text()
+        if case_sensitive and not strict and self._html is not None:
+            if isinstance(self._html, bytes):
+                return text.encode('utf-8') in self._html
+            return text in self._html
+
+        if self._page_text is None:
+            self._page_text = self._extract_page_text()
 
         if not case_sensitive:
-            return text.lower() in page_text.lower()
+            if self._page_text_lower is None:
+                self._page_text_lower = self._page_text.lower()
+            return text.lower() in self._page_text_lower
 
-        return text in page_text
+        return text in self._page_text
+
+    def _extract_page_text(self) -> str:
+        """Get the text content of the whole document."""
+        return self.tree.text_content()
 
     def __str__(self) -> str:
         """String representation."""
-        return f"SelectorEngine(html_length={len(str(self.soup))})"
+        if self._html is None:
+            return f"SelectorEngine(tree=<{self.tree.tag}>)"
+        return f"SelectorEngine(html_length={len(self._html)})"
+
+
+def create_engine(html: Union[str, bytes]) -> SelectorEngine:
+    """
+    Create the fastest available selector engine for a page.
+
+    Uses the selectolax (Lexbor) engine when selectolax is installed and
+    the lxml engine otherwise; both expose the same API.
+
+    Args:
+        html: HTML content to parse, as str or UTF-8 bytes
+
+    Returns:
+        Selector engine over the parsed page
+    """
+    # Imported here: lexbor_engine subclasses SelectorEngine
+    from parsers.lexbor_engine import LexborSelectorEngine, LexborHTMLParser
+
+    if LexborHTMLParser is not None:
+        return LexborSelectorEngine(html)
+    return SelectorEngine(html)
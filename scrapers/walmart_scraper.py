@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Walmart-specific scraper implementation."""
-import asyncio
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Union
 from datetime import datetime
+from urllib.parse import quote_plus
+
+import aiohttp
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
 import sys
 from pathlib import Path
@@ -10,12 +13,51 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.base_scraper import BaseScraper
 from models.product import Product
-from parsers.selector_engine import SelectorEngine
-from utils.normalizers import normalize_price, parse_availability, normalize_rating
+from parsers import json_ld
+from parsers.selector_engine import SelectorEngine, create_engine
+from utils.normalizers import (
+    normalize_price, parse_availability, normalize_rating, normalize_count,
+    discount_percent,
+)
 from utils.logger import setup_logger
 
 logger = setup_logger('walmart_scraper', level='INFO')
 
+# Single-value product selector groups read by _selector_details()
+_TEXT_FIELDS = (
+    'name', 'current_price', 'original_price', 'stock_status', 'rating_avg',
+    'rating_count', 'free_shipping', 'delivery_date', 'brand', 'model', 'description',
+)
+
+# Timeout for plain HTTP product page fetches
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=20)
+
+# Markers of a server-rendered product page: the Next.js state script and
+# the product object inside it. Bot walls and error pages served with a
+# 200 have neither.
+_PRODUCT_DATA_MARKERS = ('id="__NEXT_DATA__"', '"product":{')
+_PRODUCT_DATA_MARKERS_UTF8 = tuple(marker.encode() for marker in _PRODUCT_DATA_MARKERS)
+
+# Time (ms) to wait for the scraped content after the DOM has loaded
+_READY_TIMEOUT = 10000
+
+# Per-selector timeout (ms) when trying fallbacks on an element that
+# has already been waited for
+_FALLBACK_TIMEOUT = 1000
+
+
+def _any_of(selectors: Sequence[str]) -> str:
+    """
+    Join fallback selectors into one selector list matching any of them.
+
+    Args:
+        selectors: CSS selectors (Playwright pseudo-classes allowed)
+
+    Returns:
+        Comma-separated selector list
+    """
+    return ', '.join(selectors)
+
 
 class WalmartScraper(BaseScraper):
     """
@@ -27,6 +69,41 @@ class WalmartScraper(BaseScraper):
     - Full product detail extraction
     """
 
+    def __init__(self, config, **kwargs):
+        """
+        Initialize Walmart scraper.
+
+        Args:
+            config: Walmart configuration dictionary
+            **kwargs: Dependencies passed through to BaseScraper
+        """
+        super().__init__(config, **kwargs)
+
+        # Bound once; search queries are URL-encoded before formatting.
+        # None if the config has no search URL (search_products raises)
+        template = self._cfg.search_url_template
+        self._search_url = template.format if template else None
+
+        # Compile the configured selector fallbacks once for every page
+        self._link_selectors = SelectorEngine.compile(self._cfg.product_link_selectors)
+        self._product_selectors = {
+            name: SelectorEngine.compile(selectors)
+            for name, selectors in self._cfg.product_selectors.items()
+        }
+        # Single-value text fields, extracted together in parse_product
+        self._text_fields = {
+            name: self._product_selectors[name] for name in _TEXT_FIELDS
+            if name in self._product_selectors
+        }
+        self._specs_selectors = self._product_selectors.get('specs_table', ())
+        self._image_selectors = self._product_selectors.get('images', ())
+        # Location step -> selector that last worked for it
+        self._good_selectors: Dict[str, str] = {}
+
+        # Browser cookies (name -> value) sent with plain HTTP fetches,
+        # captured on first use after the location is set
+        self._http_cookies: Optional[Dict[str, str]] = None
+
     async def set_location(self, zipcode: str) -> bool:
         """
         Set location using Walmart's location modal.
@@ -38,7 +115,8 @@ class WalmartScraper(BaseScraper):
             True if location was successfully set
         """
         try:
-            logger.info(f"[Walmart] Setting location to zipcode: {zipcode}")
+            logger.info("[Walmart] Setting location to zipcode: %s", zipcode)
+            self._http_cookies = None
 
             # Check rate limit
             if self.rate_limiter:
@@ -48,86 +126,152 @@ class WalmartScraper(BaseScraper):
             if self.session_manager:
                 cookies = self.session_manager.get_cookies('walmart', zipcode)
                 if cookies:
-                    logger.info(f"[Walmart] Restored session from cache for {zipcode}")
+                    logger.info("[Walmart] Restored session from cache for %s", zipcode)
                     await self.browser_driver.set_cookies(cookies)
                     self.current_zipcode = zipcode
                     return True
 
-            # Navigate to Walmart homepage
-            await self.browser_driver.get('https://www.walmart.com', wait_until='load')
-            await asyncio.sleep(2)  # Let page settle
+            # Navigate to Walmart homepage and wait until a location button
+            # (any of the fallbacks) is visible
+            await self.browser_driver.get('https://www.walmart.com')
+            await self._wait_for_step('location_button', timeout=30000)
 
             # Find and click location button
-            location_buttons = self.config['location']['selectors']['location_button']
-            clicked = False
-
-            for selector in location_buttons:
-                try:
-                    await self.browser_driver.click(selector, timeout=5000)
-                    clicked = True
-                    logger.info(f"[Walmart] Clicked location button: {selector}")
-                    break
-                except Exception:
-                    continue
-
-            if not clicked:
+            selector = await self._first_working('location_button', self._click)
+            if selector is None:
                 logger.error("[Walmart] Failed to find/click location button")
                 return False
+            logger.info("[Walmart] Clicked location button: %s", selector)
 
             # Wait for modal to appear
-            await asyncio.sleep(2)
+            await self._wait_for_step('zipcode_input', timeout=5000)
 
             # Find and fill zipcode input
-            zipcode_inputs = self.config['location']['selectors']['zipcode_input']
-            filled = False
-
-            for selector in zipcode_inputs:
-                try:
-                    await self.browser_driver.fill(selector, zipcode, timeout=5000)
-                    filled = True
-                    logger.info(f"[Walmart] Filled zipcode input: {selector}")
-                    break
-                except Exception:
-                    continue
-
-            if not filled:
+            selector = await self._first_working(
+                'zipcode_input',
+                lambda selector: self.browser_driver.fill(
+                    selector, zipcode, timeout=_FALLBACK_TIMEOUT
+                ),
+            )
+            if selector is None:
                 logger.error("[Walmart] Failed to find/fill zipcode input")
                 return False
+            logger.info("[Walmart] Filled zipcode input: %s", selector)
 
             # Click submit button
-            submit_buttons = self.config['location']['selectors']['submit_button']
-            submitted = False
-
-            for selector in submit_buttons:
-                try:
-                    await self.browser_driver.click(selector, timeout=5000)
-                    submitted = True
-                    logger.info(f"[Walmart] Clicked submit button: {selector}")
-                    break
-                except Exception:
-                    continue
-
-            if not submitted:
+            selector = await self._first_working('submit_button', self._click)
+            if selector is None:
                 logger.error("[Walmart] Failed to find/click submit button")
                 return False
+            logger.info("[Walmart] Clicked submit button: %s", selector)
 
-            # Wait for location update
-            await asyncio.sleep(3)
+            # Wait for location update, i.e. the modal closing
+            await self._wait_for_step('zipcode_input', timeout=10000, state='hidden')
 
             # Save cookies for session reuse
             if self.session_manager:
                 cookies = await self.browser_driver.get_cookies()
                 self.session_manager.save_session('walmart', zipcode, cookies)
-                logger.info(f"[Walmart] Saved session for {zipcode}")
+                logger.info("[Walmart] Saved session for %s", zipcode)
 
             self.current_zipcode = zipcode
-            logger.info(f"[Walmart] Successfully set location to {zipcode}")
+            logger.info("[Walmart] Successfully set location to %s", zipcode)
             return True
 
         except Exception as e:
-            logger.error(f"[Walmart] Error setting location: {e}")
+            logger.error("[Walmart] Error setting location: %s", e)
             return False
 
+    async def _wait_for_step(self, step: str, timeout: int, state: str = 'visible') -> None:
+        """
+        Wait for any selector of a location step to reach a state.
+
+        A timeout is logged and otherwise ignored: the step's own actions
+        still try each selector, so a slow or missing modal is handled
+        there rather than aborting location setup.
+
+        Args:
+            step: Key of the step in the location selectors config
+            timeout: Wait timeout in milliseconds
+            state: Element state to wait for ('visible', 'attached', 'hidden')
+        """
+        try:
+            await self.browser_driver.wait_for_selector(
+                _any_of(self._cfg.location_selectors[step]), timeout=timeout, state=state
+            )
+        except PlaywrightTimeoutError:
+            logger.info("[Walmart] No %s %s after %sms, continuing", step, state, timeout)
+
+    async def _load(self, page: Page, url: str, ready_selectors: Sequence[str]) -> str:
+        """
+        Navigate to a page and get its HTML once it is ready to scrape.
+
+        Waits for the DOM and then for any of the ready selectors, rather
+        than for network idle, which Walmart's trackers can hold off
+        indefinitely. If no ready selector shows up in time, the page is
+        returned as it is.
+
+        Args:
+            page: Page to navigate
+            url: URL to load
+            ready_selectors: Selectors for the content that will be scraped
+
+        Returns:
+            Page HTML content
+
+        Raises:
+            RuntimeError: If browser is not started
+        """
+        if page is None:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+
+        if ready_selectors:
+            try:
+                await page.wait_for_selector(_any_of(ready_selectors), timeout=_READY_TIMEOUT)
+            except PlaywrightTimeoutError:
+                logger.info("[Walmart] Page not ready after %sms, parsing as is: %s", _READY_TIMEOUT, url)
+
+        return await page.content()
+
+    async def _click(self, selector: str) -> None:
+        """Click an element that has already been waited for."""
+        await self.browser_driver.click(selector, timeout=_FALLBACK_TIMEOUT, wait_after=0)
+
+    async def _first_working(
+        self,
+        step: str,
+        action: Callable[[str], Awaitable[None]]
+    ) -> Optional[str]:
+        """
+        Run a location step with each of its fallback selectors until one works.
+
+        The selector that worked is tried first the next time the step
+        runs, so a stable page layout never pays for failing fallbacks.
+
+        Args:
+            step: Key of the step in the location selectors config
+            action: Coroutine function performing the step on a selector
+
+        Returns:
+            Selector that worked, or None if all of them failed
+        """
+        selectors = self._cfg.location_selectors[step]
+        good = self._good_selectors.get(step)
+        if good is not None:
+            selectors = (good,) + tuple(s for s in selectors if s != good)
+
+        for selector in selectors:
+            try:
+                await action(selector)
+            except Exception:
+                continue
+            self._good_selectors[step] = selector
+            return selector
+
+        return None
+
     async def search_products(
         self,
         query: str,
@@ -145,33 +289,28 @@ class WalmartScraper(BaseScraper):
             List of product page URLs
         """
         try:
-            logger.info(f"[Walmart] Searching for: {query} (max: {max_results})")
+            logger.info("[Walmart] Searching for: %s (max: %s)", query, max_results)
+
+            if self._search_url is None:
+                raise ValueError("search.url_template is not configured for walmart")
 
             # Check rate limit
             if self.rate_limiter:
                 await self.rate_limiter.acquire('walmart')
 
             # Build search URL
-            search_url = self.config['search']['url_template'].format(
-                query=query.replace(' ', '+'),
-                page=1
-            )
+            search_url = self._search_url(query=quote_plus(query), page=1)
 
-            # Navigate to search page
-            await self.browser_driver.get(search_url, wait_until='networkidle')
-            await asyncio.sleep(2)
+            # Navigate to search page and wait for the result cards
+            html = await self._load(
+                self.browser_driver.page, search_url, self._cfg.product_card_selectors
+            )
 
             product_urls = []
-
-            # Extract product links
-            product_card_selectors = self.config['search']['selectors']['product_cards']
-            product_link_selectors = self.config['search']['selectors']['product_link']
-
-            html = await self.browser_driver.page.content()
             engine = SelectorEngine(html)
 
             # Find product links
-            links = engine.select_many(product_link_selectors, attr='href', limit=max_results)
+            links = engine.select_many_compiled(self._link_selectors, attr='href', limit=max_results)
 
             for link in links:
                 # Make absolute URL
@@ -179,148 +318,256 @@ class WalmartScraper(BaseScraper):
                     link = 'https://www.walmart.com' + link
                 product_urls.append(link)
 
-            logger.info(f"[Walmart] Found {len(product_urls)} product URLs")
+            logger.info("[Walmart] Found %s product URLs", len(product_urls))
             return product_urls[:max_results]
 
         except Exception as e:
-            logger.error(f"[Walmart] Error searching products: {e}")
+            logger.error("[Walmart] Error searching products: %s", e)
             return []
 
-    async def get_product_details(self, product_url: str) -> Optional[Product]:
+    async def get_product_details(
+        self,
+        product_url: str,
+        scraped_at: Optional[datetime] = None
+    ) -> Optional[Product]:
         """
         Get full product details from a product page.
 
         Args:
             product_url: Product page URL
+            scraped_at: Timestamp to record on the product (default: now)
 
         Returns:
             Product object with all scraped details
         """
         try:
-            logger.info(f"[Walmart] Fetching product: {product_url}")
-
-            # Check rate limit
-            if self.rate_limiter:
-                await self.rate_limiter.acquire('walmart')
-
-            # Navigate to product page
-            await self.browser_driver.get(product_url, wait_until='networkidle', timeout=30000)
-            await asyncio.sleep(2)
-
-            # Get HTML content
-            html = await self.browser_driver.page.content()
+            logger.info("[Walmart] Fetching product: %s", product_url)
+
+            # Fast path: fetch the page without rendering it
+            if self._cfg.http_first:
+                product = await self._get_product_over_http(product_url, scraped_at)
+                if product:
+                    logger.info("[Walmart] Scraped: %s - $%s", product.name, product.current_price)
+                    return product
+
+            # Navigate on a pooled page so concurrent fetches don't share one tab
+            async with self.browser_driver.lease_page() as page:
+                # Check rate limit only once a page is free, so fetches queued
+                # for the pool don't use up request slots while they wait
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire('walmart')
+
+                # Navigate and wait for the product title
+                html = await self._load(
+                    page, product_url, self._cfg.product_selectors.get('name', ())
+                )
 
             # Parse product
-            product = self.parse_product(html, product_url)
+            product = self.parse_product(html, product_url, scraped_at)
 
             if product:
-                logger.info(f"[Walmart] Scraped: {product.name} - ${product.current_price}")
+                logger.info("[Walmart] Scraped: %s - $%s", product.name, product.current_price)
             else:
-                logger.warning(f"[Walmart] Failed to parse product from {product_url}")
+                logger.warning("[Walmart] Failed to parse product from %s", product_url)
 
             return product
 
         except Exception as e:
-            logger.error(f"[Walmart] Error fetching product details: {e}")
+            logger.error("[Walmart] Error fetching product details: %s", e)
             return None
 
-    def parse_product(self, html: str, url: str) -> Optional[Product]:
+    async def _get_product_over_http(
+        self,
+        product_url: str,
+        scraped_at: Optional[datetime] = None
+    ) -> Optional[Product]:
         """
-        Parse product data from HTML.
+        Fetch and parse a product page with the shared HTTP session.
+
+        Sends the browser's cookies and user agent so the page is served
+        for the same location. Any failure, a blocked response or a page
+        without server-rendered product data returns None, so the caller
+        can fall back to the browser.
 
         Args:
-            html: HTML content of product page
-            url: Product URL
+            product_url: Product page URL
+            scraped_at: Timestamp to record on the product (default: now)
 
         Returns:
-            Product object or None if parsing failed
+            Product object, or None if the page couldn't be used
         """
         try:
-            engine = SelectorEngine(html)
-            selectors = self.config['product']['selectors']
+            if self._http_cookies is None and self.browser_driver and self.browser_driver.context:
+                self._http_cookies = {
+                    cookie['name']: cookie['value']
+                    for cookie in await self.browser_driver.get_cookies()
+                }
 
-            # Extract product name (required)
-            name = engine.select_one(selectors['name'])
-            if not name:
-                logger.warning("[Walmart] Failed to extract product name")
-                return None
+            headers = {'Accept': 'text/html'}
+            if self.browser_driver and self.browser_driver.user_agent:
+                headers['User-Agent'] = self.browser_driver.user_agent
 
-            # Extract prices
-            current_price_str = engine.select_one(selectors['current_price'])
-            original_price_str = engine.select_one(selectors['original_price'])
+            # Check rate limit
+            if self.rate_limiter:
+                await self.rate_limiter.acquire('walmart')
 
-            current_price = normalize_price(current_price_str)
-            original_price = normalize_price(original_price_str)
+            async with self._get_http().get(
+                product_url,
+                headers=headers,
+                cookies=self._http_cookies,
+                timeout=_HTTP_TIMEOUT,
+            ) as response:
+                # Bot checks redirect to /blocked
+                if response.status != 200 or response.url.path.startswith('/blocked'):
+                    if self.rate_limiter and response.status == 429:
+                        retry_after = response.headers.get('Retry-After', '')
+                        self.rate_limiter.trigger_backoff(
+                            'walmart',
+                            retry_after=float(retry_after) if retry_after.isdigit() else None,
+                        )
+                    logger.info(
+                        "[Walmart] HTTP fetch got %s, using browser: %s",
+                        response.status, product_url
+                    )
+                    return None
+                # Parsers take UTF-8 bytes directly; skip decoding to str
+                if (response.charset or 'utf-8').lower() in ('utf-8', 'utf8'):
+                    html = await response.read()
+                    markers = _PRODUCT_DATA_MARKERS_UTF8
+                else:
+                    html = await response.text()
+                    markers = _PRODUCT_DATA_MARKERS
+        except Exception as e:
+            logger.info("[Walmart] HTTP fetch failed (%r), using browser: %s", e, product_url)
+            return None
 
-            # Calculate discount if applicable
-            discount_percent = None
-            if current_price and original_price and original_price > current_price:
-                discount_percent = ((original_price - current_price) / original_price) * 100
+        if not all(marker in html for marker in markers):
+            logger.info("[Walmart] HTTP page has no product data, using browser: %s", product_url)
+            return None
+
+        return self.parse_product(html, product_url, scraped_at)
 
-            # Extract availability
-            stock_status_text = engine.select_one(selectors['stock_status'])
-            availability = parse_availability(stock_status_text)
+    def parse_product(
+        self,
+        html: Union[str, bytes],
+        url: str,
+        scraped_at: Optional[datetime] = None
+    ) -> Optional[Product]:
+        """
+        Parse product data from HTML.
 
-            # Extract ratings
-            rating_avg_str = engine.select_one(selectors['rating_avg'])
-            rating_count_str = engine.select_one(selectors['rating_count'])
+        Args:
+            html: HTML content of product page, as str or UTF-8 bytes
+            url: Product URL
+            scraped_at: Timestamp to record on the product (default: now)
 
-            rating_avg = normalize_rating(rating_avg_str)
-            rating_count = None
-            if rating_count_str:
-                import re
-                match = re.search(r'(\d+)', rating_count_str)
-                if match:
-                    rating_count = int(match.group(1))
+        Returns:
+            Product object or None if parsing failed
+        """
+        try:
+            # Parse once (with Lexbor when available)
+            engine = create_engine(html)
 
-            # Extract shipping info
-            free_shipping_text = engine.select_one(selectors['free_shipping'])
-            free_shipping = free_shipping_text is not None and 'free' in free_shipping_text.lower()
+            # Prefer the page's structured record; selectors fill the rest
+            record = json_ld.product_fields(engine) or {}
+            details = self._selector_details(engine, self._missing_fields(record))
+            details.update((key, value) for key, value in record.items() if value is not None)
 
-            delivery_date = engine.select_one(selectors['delivery_date'])
+            # Product name is required
+            if not details['name']:
+                logger.warning("[Walmart] Failed to extract product name")
+                return None
 
-            # Extract product details
-            brand = engine.select_one(selectors['brand'])
-            model = engine.select_one(selectors['model'])
-            description = engine.select_one(selectors['description'])
+            # Calculate discount if applicable
+            details['discount_percent'] = discount_percent(
+                details['current_price'], details['original_price']
+            )
 
             # Extract specifications table
-            specs = engine.extract_table(selectors['specs_table'])
+            specs = engine.extract_table_compiled(self._specs_selectors)
 
             # Extract images
-            image_urls = engine.select_many(selectors['images'], attr='src', limit=5)
+            image_urls = details.pop('image_urls', None) or engine.select_many_compiled(
+                self._image_selectors, attr='src', limit=5
+            )
 
             # Create product object
             product = Product(
-                name=name,
                 url=url,
                 site='walmart',
                 zipcode=self.current_zipcode or 'unknown',
-                scraped_at=datetime.now(),
-                current_price=current_price,
-                original_price=original_price,
-                discount_percent=discount_percent,
-                in_stock=availability['in_stock'],
-                quantity_available=availability.get('quantity'),
-                stock_status_text=stock_status_text,
-                rating_avg=rating_avg,
-                rating_count=rating_count,
-                free_shipping=free_shipping,
-                delivery_date=delivery_date,
-                brand=brand,
-                model=model,
-                description=description,
+                scraped_at=scraped_at or datetime.now(),
                 specs=specs if specs else None,
-                image_urls=image_urls if image_urls else None,
+                image_urls=image_urls[:5] if image_urls else None,
                 primary_image_url=image_urls[0] if image_urls else None,
+                **details,
             )
 
             # Validate product
             if not product.validate():
-                logger.warning(f"[Walmart] Product validation failed for {url}")
+                logger.warning("[Walmart] Product validation failed for %s", url)
 
             return product
 
         except Exception as e:
-            logger.error(f"[Walmart] Error parsing product: {e}")
+            logger.error("[Walmart] Error parsing product: %s", e)
             return None
+
+    def _missing_fields(self, record: dict) -> dict:
+        """
+        Get the selector groups needed for fields a JSON-LD record lacks.
+
+        Groups are named after the Product field they fill; stock_status
+        is always queried, since only the page gives quantity_available.
+
+        Args:
+            record: Fields from json_ld.product_fields() (empty if none)
+
+        Returns:
+            Subset of _text_fields to query
+        """
+        if not record:
+            return self._text_fields
+
+        return {
+            name: compiled for name, compiled in self._text_fields.items()
+            if record.get(name) is None
+        }
+
+    def _selector_details(self, engine: SelectorEngine, text_fields: dict) -> dict:
+        """
+        Extract product fields with the configured CSS selectors.
+
+        Args:
+            engine: Selector engine over the product page
+            text_fields: Selector groups to query (see _text_fields)
+
+        Returns:
+            Dictionary of Product keyword arguments; fields whose selectors
+            weren't queried or didn't match are None
+        """
+        fields = engine.select_fields_compiled(text_fields)
+
+        # Extract availability
+        stock_status_text = fields.get('stock_status')
+        availability = parse_availability(stock_status_text)
+
+        # Extract shipping info
+        free_shipping_text = fields.get('free_shipping')
+        free_shipping = free_shipping_text is not None and 'free' in free_shipping_text.lower()
+
+        return {
+            'name': fields.get('name'),
+            'current_price': normalize_price(fields.get('current_price')),
+            'original_price': normalize_price(fields.get('original_price')),
+            'in_stock': availability['in_stock'],
+            'quantity_available': availability.get('quantity'),
+            'stock_status_text': stock_status_text,
+            'rating_avg': normalize_rating(fields.get('rating_avg')),
+            'rating_count': normalize_count(fields.get('rating_count')),
+            'free_shipping': free_shipping,
+            'delivery_date': fields.get('delivery_date'),
+            'brand': fields.get('brand'),
+            'model': fields.get('model'),
+            'description': fields.get('description'),
+        }
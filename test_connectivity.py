@@ -2,7 +2,8 @@
 """Test script to diagnose network/DNS issues."""
 import asyncio
 import socket
-from playwright.async_api import async_playwright
+from typing import Optional
+from playwright.async_api import async_playwright, Playwright
 
 
 async def test_dns():
@@ -17,43 +18,49 @@ async def test_dns():
         return False
 
 
-async def test_playwright_chromium():
-    """Test if Playwright Chromium can connect."""
+async def test_playwright_chromium(p: Optional[Playwright] = None):
+    """Test if Playwright Chromium can connect (on a shared Playwright if given)."""
+    if p is None:
+        async with async_playwright() as p:
+            return await test_playwright_chromium(p)
+
     print("\nTesting Playwright Chromium...")
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-web-security']
-            )
-            page = await browser.new_page()
-
-            # Try to navigate
-            print("Attempting to navigate to walmart.com...")
-            await page.goto('https://www.walmart.com/', timeout=15000)
-            title = await page.title()
-            print(f"✓ Chromium works: Page title = {title}")
-            await browser.close()
-            return True
+        browser = await p.chromium.launch(
+            headless=True,
+            args=['--no-sandbox', '--disable-web-security']
+        )
+        page = await browser.new_page()
+
+        # Try to navigate
+        print("Attempting to navigate to walmart.com...")
+        await page.goto('https://www.walmart.com/', timeout=15000)
+        title = await page.title()
+        print(f"✓ Chromium works: Page title = {title}")
+        await browser.close()
+        return True
     except Exception as e:
         print(f"✗ Chromium failed: {e}")
         return False
 
 
-async def test_playwright_firefox():
-    """Test if Playwright Firefox can connect."""
+async def test_playwright_firefox(p: Optional[Playwright] = None):
+    """Test if Playwright Firefox can connect (on a shared Playwright if given)."""
+    if p is None:
+        async with async_playwright() as p:
+            return await test_playwright_firefox(p)
+
     print("\nTesting Playwright Firefox...")
     try:
-        async with async_playwright() as p:
-            browser = await p.firefox.launch(headless=True)
-            page = await browser.new_page()
-
-            print("Attempting to navigate to walmart.com...")
-            await page.goto('https://www.walmart.com/', timeout=15000)
-            title = await page.title()
-            print(f"✓ Firefox works: Page title = {title}")
-            await browser.close()
-            return True
+        browser = await p.firefox.launch(headless=True)
+        page = await browser.new_page()
+
+        print("Attempting to navigate to walmart.com...")
+        await page.goto('https://www.walmart.com/', timeout=15000)
+        title = await page.title()
+        print(f"✓ Firefox works: Page title = {title}")
+        await browser.close()
+        return True
     except Exception as e:
         print(f"✗ Firefox failed: {e}")
         return False
@@ -67,11 +74,12 @@ async def main():
     # Test DNS
     dns_works = await test_dns()
 
-    # Test Playwright browsers
-    chromium_works = await test_playwright_chromium()
+    # Test Playwright browsers, starting Playwright once for all of them
+    async with async_playwright() as p:
+        chromium_works = await test_playwright_chromium(p)
 
-    # Only test Firefox if installed
-    # firefox_works = await test_playwright_firefox()
+        # Only test Firefox if installed
+        # firefox_works = await test_playwright_firefox(p)
 
     print("\n" + "="*60)
     print("Summary:")
@@ -0,0 +1,134 @@
+"""Tests for ProductBatch."""
+import math
+from datetime import datetime
+
+import pytest
+
+from models.product import Product, ProductBatch
+
+
+def _product(**kwargs):
+    return Product(
+        name=kwargs.pop('name', 'Widget'),
+        url=kwargs.pop('url', 'https://www.walmart.com/ip/1'),
+        site='walmart',
+        zipcode='10001',
+        **kwargs,
+    )
+
+
+FULL_PRODUCT = _product(
+    scraped_at=datetime(2026, 1, 2, 3, 4, 5),
+    current_price=9.99,
+    original_price=14.99,
+    discount_percent=33.36,
+    in_stock=True,
+    quantity_available=7,
+    stock_status_text='In stock',
+    rating_avg=4.5,
+    rating_count=1200,
+    review_summary='Great',
+    shipping_cost=0.0,
+    free_shipping=True,
+    delivery_date='Tomorrow',
+    delivery_days=1,
+    brand='Acme',
+    model='W-1',
+    upc='012345678905',
+    sku='123',
+    category='Tools',
+    specs={'Color': 'Red'},
+    description='A widget',
+    image_urls=['https://i5.walmartimages.com/a.jpg'],
+    primary_image_url='https://i5.walmartimages.com/a.jpg',
+    product_id='1',
+)
+
+ROUND_TRIP_PRODUCTS = [FULL_PRODUCT, _product(), _product(quantity_available=0, rating_count=0)]
+
+EDGE_PRODUCTS = [
+    _product(),
+    _product(name=''),
+    _product(current_price=0.0, original_price=19.99, rating_avg=5.0),
+    _product(current_price=-0.01),
+    _product(current_price=math.nan),
+    _product(original_price=math.nan),
+    _product(rating_avg=math.nan),
+    _product(rating_avg=5.1),
+    _product(rating_count=0, quantity_available=0),
+    _product(rating_count=-1),
+    _product(quantity_available=-1),
+]
+
+
+def test_to_products_round_trip():
+    batch = ProductBatch(ROUND_TRIP_PRODUCTS)
+    assert len(batch) == len(ROUND_TRIP_PRODUCTS)
+    assert batch.to_products() == ROUND_TRIP_PRODUCTS
+
+
+def test_to_records_matches_to_dict():
+    assert ProductBatch([FULL_PRODUCT]).to_records() == [FULL_PRODUCT.to_dict()]
+
+
+def test_append_matches_constructor():
+    batch = ProductBatch()
+    for product in ROUND_TRIP_PRODUCTS:
+        batch.append(product)
+    assert batch.to_products() == ProductBatch(ROUND_TRIP_PRODUCTS).to_products()
+
+
+def test_to_arrow_round_trip():
+    pytest.importorskip('pyarrow')
+    rows = ProductBatch(ROUND_TRIP_PRODUCTS).to_arrow().to_pylist()
+
+    restored = []
+    for row in rows:
+        if row['specs'] is not None:
+            row['specs'] = dict(row['specs'])
+        restored.append(Product(**row))
+    assert restored == ROUND_TRIP_PRODUCTS
+
+
+def test_negative_ints_survive_round_trip():
+    product = _product(rating_count=-1, quantity_available=-1)
+    restored, = ProductBatch([product]).to_products()
+    assert restored.rating_count == -1
+    assert restored.quantity_available == -1
+
+
+def test_nan_and_missing_floats_stay_apart():
+    nan_price, no_price = ProductBatch([_product(current_price=math.nan), _product()]).to_products()
+    assert math.isnan(nan_price.current_price)
+    assert no_price.current_price is None
+
+
+@pytest.mark.parametrize('product', EDGE_PRODUCTS, ids=repr)
+def test_validate_matches_product_validate(product):
+    result, = ProductBatch([product]).validate()
+    assert result is product.validate()
+
+
+def test_validate_whole_batch():
+    results = ProductBatch(EDGE_PRODUCTS).validate()
+    assert len(results) == len(EDGE_PRODUCTS)
+    for result, product in zip(results, EDGE_PRODUCTS):
+        assert result is product.validate()
+
+
+def test_write_parquet_round_trip(tmp_path):
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+    products = [_product(current_price=9.99, rating_count=3), _product()]
+    path = tmp_path / 'products.parquet'
+
+    ProductBatch(products).write_parquet(str(path))
+
+    table = pyarrow_parquet.read_table(path)
+    assert table.column('current_price').to_pylist() == [9.99, None]
+    assert table.column('rating_count').to_pylist() == [3, None]
+
+
+def test_write_parquet_without_pyarrow(monkeypatch, tmp_path):
+    monkeypatch.setattr('models.product.pyarrow', None)
+    with pytest.raises(RuntimeError):
+        ProductBatch([_product()]).write_parquet(str(tmp_path / 'products.parquet'))
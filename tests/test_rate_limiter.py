@@ -0,0 +1,150 @@
+"""Tests for RateLimiter timing, with a fake clock."""
+import asyncio
+
+import pytest
+
+from core import rate_limiter
+from core.rate_limiter import RateLimiter
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        # Let other tasks run, as a real sleep would
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(rate_limiter.asyncio, 'sleep', clock.sleep)
+    return clock
+
+
+def _limiter(requests_per_minute=60, delay=0.0):
+    # Equal min and max delay make the random delay deterministic
+    return RateLimiter(requests_per_minute, min_delay=delay, max_delay=delay)
+
+
+def test_acquire_sleeps_once_for_the_computed_token_wait(clock):
+    limiter = _limiter(requests_per_minute=60)
+    limiter._refill_tokens('walmart')
+    limiter.tokens['walmart'] = 0.25
+
+    asyncio.run(limiter.acquire('walmart'))
+
+    # 0.75 of a token at one token per second, then the (zero) random delay
+    assert clock.sleeps == [pytest.approx(0.75), 0.0]
+    assert limiter.tokens['walmart'] == pytest.approx(0.0)
+
+
+def test_acquire_does_not_wait_with_tokens_left(clock):
+    limiter = _limiter(requests_per_minute=10)
+
+    asyncio.run(limiter.acquire('walmart'))
+
+    assert clock.sleeps == [0.0]
+    assert limiter.tokens['walmart'] == pytest.approx(9.0)
+
+
+def test_get_wait_time_refills_linearly(clock):
+    limiter = _limiter(requests_per_minute=30)
+    limiter._refill_tokens('walmart')
+    limiter.tokens['walmart'] = 0.0
+
+    assert limiter.get_wait_time('walmart') == pytest.approx(2.0)
+    clock.now += 1.5
+    assert limiter.get_wait_time('walmart') == pytest.approx(0.5)
+
+
+def test_delay_is_measured_from_the_last_request(clock):
+    limiter = _limiter(requests_per_minute=60, delay=3.0)
+
+    async def two_requests():
+        await limiter.acquire('walmart')
+        clock.now += 1.0
+        await limiter.acquire('walmart')
+
+    asyncio.run(two_requests())
+
+    assert clock.sleeps == [3.0, pytest.approx(2.0)]
+
+
+def test_retry_after_sets_a_deadline(clock):
+    limiter = _limiter()
+
+    limiter.trigger_backoff('walmart', retry_after=30)
+
+    assert limiter.backoff_until['walmart'] == 1030.0
+    assert limiter.get_backoff_multiplier('walmart') == 1.0
+
+
+def test_acquire_waits_out_retry_after_once(clock):
+    limiter = _limiter()
+    limiter.trigger_backoff('walmart', retry_after=30)
+
+    async def two_requests():
+        clock.now += 10.0
+        await limiter.acquire('walmart')
+        await limiter.acquire('walmart')
+
+    asyncio.run(two_requests())
+
+    # 20s left of the cool-down, then only the first request's random delay
+    assert clock.sleeps == [pytest.approx(20.0), 0.0]
+    assert 'walmart' not in limiter.backoff_until
+
+
+def test_expired_retry_after_does_not_wait(clock):
+    limiter = _limiter()
+    limiter.trigger_backoff('walmart', retry_after=5)
+    clock.now += 6.0
+
+    asyncio.run(limiter.acquire('walmart'))
+
+    assert clock.sleeps == [0.0]
+
+
+def test_backoff_without_retry_after_scales_delays(clock):
+    limiter = _limiter(delay=2.0)
+    limiter.trigger_backoff('walmart')
+    limiter.trigger_backoff('walmart')
+
+    asyncio.run(limiter.acquire('walmart'))
+
+    assert limiter.get_backoff_multiplier('walmart') == 4.0
+    assert clock.sleeps == [8.0]
+
+    limiter.reset_backoff('walmart')
+    assert limiter.get_backoff_multiplier('walmart') == 1.0
+
+
+def test_concurrent_acquires_for_a_site_are_serialized(clock):
+    limiter = _limiter(requests_per_minute=60, delay=1.0)
+    done = []
+
+    async def request():
+        await limiter.acquire('walmart')
+        done.append(clock.now)
+
+    async def burst():
+        await asyncio.gather(*(request() for _ in range(3)))
+
+    asyncio.run(burst())
+
+    # Each caller waits for the previous one's delay to pass
+    assert done == [1001.0, 1002.0, 1003.0]
+
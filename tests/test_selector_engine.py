@@ -0,0 +1,104 @@
+"""Tests for the lxml and Lexbor selector engines."""
+import pytest
+
+from parsers.selector_engine import SelectorEngine
+
+try:
+    from parsers.lexbor_engine import LexborSelectorEngine
+except ImportError:
+    LexborSelectorEngine = None
+
+HTML = """
+<html><body>
+  <a class="x" href="/one">One</a>
+  <a class="y" href="/two">Two</a>
+  <a class="z" href="/three">Three</a>
+  <a class="x">No href</a>
+  <a class="y" href="   ">Blank</a>
+</body></html>
+"""
+
+ENGINES = [SelectorEngine]
+if LexborSelectorEngine is not None:
+    ENGINES.append(LexborSelectorEngine)
+
+
+@pytest.fixture(params=ENGINES, ids=lambda cls: cls.__name__)
+def engine(request):
+    return request.param(HTML)
+
+
+def test_select_many_attr_comma_selector(engine):
+    assert engine.select_many(['a.x, a.y'], attr='href') == ['/one', '/two']
+
+
+def test_select_many_attr_comma_selector_with_limit(engine):
+    assert engine.select_many(['a.x, a.y'], attr='href', limit=1) == ['/one']
+
+
+def test_select_many_text_comma_selector(engine):
+    assert engine.select_many(['a.x, a.z']) == ['One', 'Three', 'No href']
+
+
+def test_select_one_attr_comma_selector(engine):
+    assert engine.select_one(['a.z, a.y'], attr='href') == '/two'
+
+
+def test_engines_agree_on_bytes_input():
+    html = HTML.encode('utf-8')
+    results = {
+        cls.__name__: cls(html).select_many(['a.x, a.y, a.z'], attr='href')
+        for cls in ENGINES
+    }
+    assert len(set(map(tuple, results.values()))) == 1
+
+
+FIELDS_HTML = """
+<html><body>
+  <h1 class="title"></h1>
+  <h1 itemprop="name">Widget</h1>
+  <span class="price">$9.99</span>
+  <span class="price">$19.99</span>
+  <div class="brand"><a href="/brand/acme">Acme</a></div>
+  <img class="hero" src="/a.jpg"><img class="hero" src="/b.jpg">
+</body></html>
+"""
+
+FIELDS = {
+    # The first selector's match is empty, so the second one is used
+    'name': ('h1.title', 'h1[itemprop="name"]'),
+    'price': ('span.missing', 'span.price'),
+    'brand': ('.brand a, .brand',),
+    # Shares a selector with another field
+    'brand_again': ('.brand a',),
+    'missing': ('span.missing', 'div.missing'),
+    'empty': (),
+}
+
+
+def test_lxml_select_fields_matches_select_one():
+    engine = SelectorEngine(FIELDS_HTML)
+    compiled = {name: SelectorEngine.compile(selectors) for name, selectors in FIELDS.items()}
+
+    assert engine.select_fields_compiled(compiled) == {
+        name: engine.select_one_compiled(selectors) for name, selectors in compiled.items()
+    }
+    assert engine.select_fields_compiled(compiled)['name'] == 'Widget'
+
+
+def test_lxml_select_fields_attr_matches_select_one():
+    engine = SelectorEngine(FIELDS_HTML)
+    compiled = {
+        'link': SelectorEngine.compile(('h1 a', '.brand a')),
+        'image': SelectorEngine.compile(('img.hero',)),
+    }
+
+    assert engine.select_fields_compiled(compiled, attr='href') == {
+        name: engine.select_one_compiled(selectors, attr='href')
+        for name, selectors in compiled.items()
+    }
+    assert engine.select_fields_compiled(compiled, attr='src')['image'] == '/a.jpg'
+
+
+def test_lxml_select_fields_with_no_selectors():
+    assert SelectorEngine(FIELDS_HTML).select_fields_compiled({'name': ()}) == {'name': None}
@@ -0,0 +1,64 @@
+"""Tests for SessionManager's session manifest."""
+from core.session_manager import SessionManager
+
+COOKIES = [{'name': 'zip', 'value': '10001', 'domain': '.walmart.com', 'path': '/'}]
+
+
+def _zipcodes(manager, site=None):
+    return sorted(session['zipcode'] for session in manager.list_sessions(site))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    manager = SessionManager(cache_dir=tmp_path)
+    manager.save_session('walmart', '10001', COOKIES, {'store': '42'})
+
+    session = manager.load_session('walmart', '10001')
+    assert session['cookies'] == COOKIES
+    assert session['metadata'] == {'store': '42'}
+    assert _zipcodes(manager) == ['10001']
+
+
+def test_two_instances_keep_each_others_sessions(tmp_path):
+    first = SessionManager(cache_dir=tmp_path)
+    second = SessionManager(cache_dir=tmp_path)
+
+    # Both load the manifest before either saves
+    assert first.list_sessions() == []
+    assert second.list_sessions() == []
+
+    first.save_session('walmart', '10001', COOKIES)
+    second.save_session('walmart', '94105', COOKIES)
+
+    assert _zipcodes(first) == ['10001', '94105']
+    assert _zipcodes(second) == ['10001', '94105']
+    assert _zipcodes(SessionManager(cache_dir=tmp_path)) == ['10001', '94105']
+
+
+def test_delete_keeps_sessions_saved_by_another_instance(tmp_path):
+    first = SessionManager(cache_dir=tmp_path)
+    second = SessionManager(cache_dir=tmp_path)
+
+    first.save_session('walmart', '10001', COOKIES)
+    assert _zipcodes(second) == ['10001']
+    first.save_session('walmart', '94105', COOKIES)
+
+    assert second.delete_session('walmart', '10001')
+    assert _zipcodes(first) == ['94105']
+    assert _zipcodes(SessionManager(cache_dir=tmp_path)) == ['94105']
+
+
+def test_cleanup_expired_sees_sessions_saved_by_another_instance(tmp_path):
+    cleaner = SessionManager(cache_dir=tmp_path, max_age_hours=0)
+    assert cleaner.cleanup_expired() == 0
+
+    SessionManager(cache_dir=tmp_path).save_session('walmart', '10001', COOKIES)
+
+    assert cleaner.cleanup_expired() == 1
+    assert _zipcodes(SessionManager(cache_dir=tmp_path)) == []
+
+
+def test_missing_manifest_is_rebuilt(tmp_path):
+    SessionManager(cache_dir=tmp_path).save_session('walmart', '10001', COOKIES)
+    (tmp_path / SessionManager.INDEX_FILENAME).unlink()
+
+    assert _zipcodes(SessionManager(cache_dir=tmp_path), 'walmart') == ['10001']
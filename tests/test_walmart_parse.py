@@ -0,0 +1,53 @@
+"""Tests for WalmartScraper.parse_product."""
+from pathlib import Path
+
+import yaml
+
+from scrapers.walmart_scraper import WalmartScraper
+
+CONFIG = Path(__file__).parent.parent / 'config' / 'sites' / 'walmart.yaml'
+
+
+def _scraper():
+    with open(CONFIG) as f:
+        return WalmartScraper(yaml.safe_load(f))
+
+
+def _page(json_ld, body):
+    return (
+        '<html><head><script type="application/ld+json">'
+        f'{json_ld}</script></head><body>{body}</body></html>'
+    )
+
+
+def test_json_ld_fields_take_precedence():
+    html = _page(
+        '{"@type": "Product", "name": "Record TV",'
+        ' "offers": {"price": "999.00", "availability": "https://schema.org/InStock"}}',
+        '<h1 itemprop="name">Page TV</h1><span itemprop="price">$1,299.00</span>',
+    )
+    product = _scraper().parse_product(html, 'https://www.walmart.com/ip/1')
+
+    assert product.name == 'Record TV'
+    assert product.current_price == 999.0
+    assert product.in_stock is True
+
+
+def test_selectors_fill_fields_missing_from_json_ld():
+    html = _page(
+        '{"@type": "Product", "name": "Record TV", "brand": {"name": "Acme"}}',
+        '<h1 itemprop="name">Page TV</h1><span itemprop="price">$1,299.00</span>',
+    )
+    product = _scraper().parse_product(html, 'https://www.walmart.com/ip/1')
+
+    assert product.name == 'Record TV'
+    assert product.brand == 'Acme'
+    assert product.current_price == 1299.0
+
+
+def test_selectors_only_without_json_ld():
+    html = '<html><body><h1 itemprop="name">Page TV</h1><span itemprop="price">$1,299.00</span></body></html>'
+    product = _scraper().parse_product(html, 'https://www.walmart.com/ip/1')
+
+    assert product.name == 'Page TV'
+    assert product.current_price == 1299.0
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""JSON serialization helpers backed by orjson, with a stdlib fallback."""
+import dataclasses
+import json
+from datetime import date, datetime
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """
+    Encode the types orjson handles natively for the stdlib encoder.
+
+    Args:
+        obj: Object the stdlib encoder can't serialize
+
+    Returns:
+        JSON-serializable equivalent
+
+    Raises:
+        TypeError: If the object type isn't supported
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+
+    datetime values are written in ISO 8601 format and dataclasses as
+    objects of their fields.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation (default: False)
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
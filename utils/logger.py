@@ -2,7 +2,37 @@
 """Structured logging setup for webscraper."""
 import logging
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats each second's timestamp only once.
+
+    The date format has one-second resolution, so every record logged
+    within the same second shares the same asctime.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize formatter; arguments are passed to logging.Formatter."""
+        super().__init__(*args, **kwargs)
+        self._cached_time: Tuple[int, str] = (-1, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Return the record's creation time, reusing the last second's text."""
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._cached_time = (second, text)
+        return text
+
+
+# Shared by the handlers of every logger set up by setup_logger()
+_FORMATTER = _CachedTimeFormatter(
+    fmt='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
 
 
 def setup_logger(name: str = 'scraper', level: str = 'INFO') -> logging.Logger:
@@ -19,25 +49,38 @@ def setup_logger(name: str = 'scraper', level: str = 'INFO') -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Remove existing handlers
-    logger.handlers = []
+    # Configured by an earlier call; only the level may change
+    if logger.handlers:
+        return logger
 
-    # Create console handler with formatting
+    # Create console handler with formatting (filtering is left to the
+    # logger's level so later calls can change it)
     handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(getattr(logging, level.upper()))
-
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    handler.setFormatter(formatter)
-
+    handler.setFormatter(_FORMATTER)
     logger.addHandler(handler)
 
+    # Records are printed here; don't print them again via the root logger
+    logger.propagate = False
+
     return logger
 
 
+def skip_record_extras() -> None:
+    """
+    Stop collecting thread, process and caller info for log records.
+
+    setup_logger()'s format doesn't print them, so this saves work on
+    every record. It is process-wide (handlers using %(thread)d,
+    %(process)d, %(funcName)s or %(lineno)d get empty values), so only
+    an application entry point that owns logging should call it.
+    """
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Disables the stack walk that finds the calling file and line
+    logging._srcfile = None
+
+
 def log_scrape_event(
     logger: logging.Logger,
     event_type: str,
@@ -68,7 +111,3 @@ def log_scrape_event(
 
     message = " ".join(parts)
     logger.info(message)
-
-
-# Create default logger
-default_logger = setup_logger()
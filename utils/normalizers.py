@@ -4,6 +4,35 @@ import re
 from typing import Optional, Dict
 
 
+# Patterns used on every scraped product, compiled once at import
+_NUMBER = re.compile(r'\d+\.?\d*')
+_DIGITS = re.compile(r'\d+')
+# Availability keywords; group 1 is set for out-of-stock phrases
+_STOCK_WORDS = re.compile(r'(out of stock|unavailable|sold out)|limited|only')
+
+# Currency symbols and thousands separators dropped from prices
+_PRICE_STRIP = str.maketrans('', '', '$,')
+
+
+def _plain_number(text: str) -> Optional[float]:
+    """
+    Convert text that is only a decimal number (e.g. "19.99") to float.
+
+    Lets the normalizers skip the regex engine for the common case;
+    anything else (units, ranges, signs, exponents) returns None so the
+    caller falls back to its regex.
+
+    Args:
+        text: Stripped candidate string
+
+    Returns:
+        The number, or None if text is not a plain decimal number
+    """
+    if text[:1].isdigit() and text.isascii() and text.replace('.', '', 1).isdigit():
+        return float(text)
+    return None
+
+
 def normalize_price(price_str: Optional[str]) -> Optional[float]:
     """
     Normalize price string to float.
@@ -24,7 +53,12 @@ def normalize_price(price_str: Optional[str]) -> Optional[float]:
         return None
 
     # Remove currency symbols and commas
-    clean = re.sub(r'[$,]', '', str(price_str))
+    clean = str(price_str).translate(_PRICE_STRIP).strip()
+
+    # Fast path: a bare number such as "$19.99"
+    price = _plain_number(clean)
+    if price is not None:
+        return price
 
     # Handle ranges (take minimum)
     if '-' in clean:
@@ -32,7 +66,7 @@ def normalize_price(price_str: Optional[str]) -> Optional[float]:
         clean = prices[0].strip()
 
     # Extract first number (handles "19.99 USD" etc.)
-    match = re.search(r'\d+\.?\d*', clean)
+    match = _NUMBER.search(clean)
     if match:
         try:
             return float(match.group())
@@ -42,6 +76,39 @@ def normalize_price(price_str: Optional[str]) -> Optional[float]:
     return None
 
 
+def discount_percent(
+    current_price: Optional[float],
+    original_price: Optional[float]
+) -> Optional[float]:
+    """
+    Calculate the discount of a sale price, in percent.
+
+    Prices are compared as integer cents, so values that are equal to
+    the cent (e.g. 19.99 and 19.990000001) don't produce a tiny discount,
+    and the result is rounded to two decimals.
+
+    Args:
+        current_price: Current/sale price
+        original_price: Price before the discount
+
+    Returns:
+        Discount percentage, or None if either price is missing or the
+        current price isn't lower
+    """
+    if not current_price or not original_price:
+        return None
+
+    current_cents = round(current_price * 100)
+    original_cents = round(original_price * 100)
+    if original_cents <= current_cents:
+        return None
+
+    # Hundredths of a percent, rounded half up in integer arithmetic
+    saved = (original_cents - current_cents) * 10000
+    hundredths = (2 * saved + original_cents) // (2 * original_cents)
+    return hundredths / 100
+
+
 def parse_availability(status_text: Optional[str]) -> Dict[str, any]:
     """
     Parse availability status text into structured data.
@@ -58,17 +125,18 @@ def parse_availability(status_text: Optional[str]) -> Dict[str, any]:
     if not status_text:
         return {'in_stock': None, 'quantity': None, 'status': 'unknown'}
 
-    status_lower = status_text.lower()
-
-    # Check for out of stock
-    if any(x in status_lower for x in ['out of stock', 'unavailable', 'sold out']):
-        return {'in_stock': False, 'quantity': 0, 'status': 'out_of_stock'}
+    # One scan for all keywords; out of stock wins wherever it appears
+    limited = False
+    for match in _STOCK_WORDS.finditer(status_text.lower()):
+        if match.group(1):
+            return {'in_stock': False, 'quantity': 0, 'status': 'out_of_stock'}
+        limited = True
 
     # Check for limited stock with quantity
-    if 'limited' in status_lower or 'only' in status_lower:
+    if limited:
         # Try to extract quantity: "Only 3 left", "Limited: 5 available"
-        match = re.search(r'(\d+)', status_text)
-        qty = int(match.group(1)) if match else None
+        match = _DIGITS.search(status_text)
+        qty = int(match.group()) if match else None
         return {'in_stock': True, 'quantity': qty, 'status': 'limited'}
 
     # Default to in stock
@@ -88,11 +156,16 @@ def normalize_rating(rating_str: Optional[str]) -> Optional[float]:
     if not rating_str:
         return None
 
-    # Extract number
-    match = re.search(r'(\d+\.?\d*)', str(rating_str))
+    # Extract number, without the regex engine for a bare "4.5"
+    rating_str = str(rating_str)
+    rating = _plain_number(rating_str.strip())
+    if rating is not None:
+        return rating if 0 <= rating <= 5 else None
+
+    match = _NUMBER.search(rating_str)
     if match:
         try:
-            rating = float(match.group(1))
+            rating = float(match.group())
             # Validate 0-5 range
             if 0 <= rating <= 5:
                 return rating
@@ -100,3 +173,20 @@ def normalize_rating(rating_str: Optional[str]) -> Optional[float]:
             pass
 
     return None
+
+
+def normalize_count(count_str: Optional[str]) -> Optional[int]:
+    """
+    Extract a count (e.g., number of reviews) from text.
+
+    Args:
+        count_str: Count string (e.g., "1234 reviews", "(56)")
+
+    Returns:
+        First integer in the string, or None if there is none
+    """
+    if not count_str:
+        return None
+
+    match = _DIGITS.search(count_str)
+    return int(match.group()) if match else None